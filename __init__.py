@@ -39,42 +39,64 @@ from .context import (
     create_context_from_grpc
 )
 
-from .logger import (
-    get_logger,
-    SDKLogger,
-    init_logger_manager
-)
+import importlib
 
-from .http_client import (
-    APIResponse,
-    ResponseBuilder,
-    create_response,
-    BusinessCode,
-    OK,
-    INTERNAL_SERVER_ERROR,
-    ROOM_NOT_FOUND,
-    UNAUTHORIZED,
-    INVALID_PARAMS,
-    HttpClient,
-    create_fastapi_middleware,
-    create_flask_middleware,
-    create_django_middleware
-)
+# 日志、HTTP 客户端和 Nacos 依赖较重（requests、火山引擎 TLS 等），
+# 改为首次访问时再导入（PEP 562），只使用上下文功能时无需承担这些开销
+_LAZY_IMPORTS = {
+    # 日志管理
+    "get_logger": ".logger",
+    "SDKLogger": ".logger",
+    "init_logger_manager": ".logger",
+    
+    # HTTP 客户端
+    "APIResponse": ".http_client",
+    "ResponseBuilder": ".http_client",
+    "create_response": ".http_client",
+    "BusinessCode": ".http_client",
+    "OK": ".http_client",
+    "INTERNAL_SERVER_ERROR": ".http_client",
+    "ROOM_NOT_FOUND": ".http_client",
+    "UNAUTHORIZED": ".http_client",
+    "INVALID_PARAMS": ".http_client",
+    "HttpClient": ".http_client",
+    "create_fastapi_middleware": ".http_client",
+    "create_flask_middleware": ".http_client",
+    "create_django_middleware": ".http_client",
+    
+    # Nacos SDK 服务发现
+    "registerNacos": ".nacos_sdk",
+    "unregisterNacos": ".nacos_sdk",
+    "init_nacos_client": ".nacos_sdk",
+    "init_service_manager": ".nacos_sdk",
+    "register_service": ".nacos_sdk",
+    "unregister_service": ".nacos_sdk",
+    "register_services_from_config": ".nacos_sdk",
+    "cleanup": ".nacos_sdk",
+    "get_config": ".nacos_sdk",
+}
 
-from .nacos_sdk import (
-    registerNacos,
-    unregisterNacos,
-    init_nacos_client,
-    init_service_manager,
-    register_service,
-    unregister_service,
-    register_services_from_config,
-    cleanup,
-    get_config
-)
+_LAZY_SUBMODULES = ("logger", "http_client", "nacos_sdk")
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 缓存到模块全局，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_SUBMODULES))
 
 # 导出所有公共 API
-__all__ = [
+__all__ = (
     # 版本信息
     "__version__",
     "__author__",
@@ -119,4 +141,4 @@ __all__ = [
     "register_services_from_config",
     "cleanup",
     "get_config"
-] 
\ No newline at end of file
+) 
\ No newline at end of file
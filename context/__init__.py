@@ -22,22 +22,30 @@
 
 from .manager import (
     Context,
+    NULL_TRACE_ID,
     create_context,
     get_current_context,
     set_context,
+    reset_context,
+    reset_trace_id,
     get_trace_id,
     create_context_from_request,
     create_context_from_grpc,
-    context_scope
+    context_scope,
+    new_span
 )
 
-__all__ = [
+__all__ = (
     'Context',
+    'NULL_TRACE_ID',
     'create_context',
     'get_current_context',
     'set_context',
+    'reset_context',
+    'reset_trace_id',
     'get_trace_id',
     'create_context_from_request',
     'create_context_from_grpc',
-    'context_scope'
-] 
\ No newline at end of file
+    'context_scope',
+    'new_span'
+) 
\ No newline at end of file
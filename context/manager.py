@@ -5,35 +5,114 @@
 自动生成 TraceID 并在整个请求周期内传递。
 """
 
+import os
+import random
 import time
-import uuid
+import threading
 import contextvars
 import logging
 from typing import Optional, Dict, Any, Union
-from contextlib import contextmanager
 
 logger = logging.getLogger("py_sdk.context")
 
-# 全局上下文变量
-_context_var: contextvars.ContextVar = contextvars.ContextVar('request_context')
+# TraceID 随机字节池（按线程缓存，一次 64KB 的 urandom 可生成 4096 个 TraceID）
+_TRACE_ID_BYTES = 16
+_TRACE_ID_POOL_SIZE = _TRACE_ID_BYTES * 4096
+_tls = threading.local()
+
+
+def _reset_trace_id_pool():
+    """fork 后丢弃继承自父进程的字节池，避免父子进程生成重复 TraceID"""
+    _tls.buf = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_trace_id_pool)
 
 
 class Context:
     """请求上下文类 - 简化版，只包含 TraceID"""
     
-    def __init__(self, trace_id: str = None):
+    __slots__ = ('_trace_id', '_trace_id_bytes', '_created_ns')
+    
+    def __init__(self, trace_id: Union[str, bytes, None] = None):
         """
         初始化上下文
         
         Args:
-            trace_id: 链路追踪ID，如果为空则自动生成
+            trace_id: 链路追踪ID（字符串或 16 字节原始值），如果为空则自动生成
         """
-        self.trace_id = trace_id or self._generate_trace_id()
-        self.created_at = time.time()
+        # 自动生成的 TraceID 只保存 16 字节原始值，十六进制字符串在首次读取时才生成
+        if not trace_id:
+            self._trace_id = None
+            self._trace_id_bytes = self._generate_trace_id_bytes()
+        elif isinstance(trace_id, bytes):
+            self._trace_id = None
+            self._trace_id_bytes = trace_id
+        else:
+            self._trace_id = trace_id
+            self._trace_id_bytes = None
+        # 以整数纳秒保存创建时间，仅在读取 created_at 时才转换为浮点秒
+        self._created_ns = time.time_ns()
+    
+    @property
+    def trace_id(self) -> str:
+        """TraceID（十六进制字符串，首次读取时生成并缓存）"""
+        trace_id = self._trace_id
+        if trace_id is None:
+            trace_id = self._trace_id = self._trace_id_bytes.hex()
+        return trace_id
+    
+    @trace_id.setter
+    def trace_id(self, value: str):
+        self._trace_id = value
+        self._trace_id_bytes = None
+    
+    @property
+    def trace_id_bytes(self) -> bytes:
+        """
+        TraceID 的原始字节
+        
+        自动生成的 TraceID 直接返回 16 字节原始值；外部传入的十六进制 TraceID 转换为字节，
+        非十六进制的自定义 TraceID 按 UTF-8 编码
+        """
+        raw = self._trace_id_bytes
+        if raw is None:
+            try:
+                raw = bytes.fromhex(self._trace_id)
+            except ValueError:
+                raw = self._trace_id.encode('utf-8')
+            self._trace_id_bytes = raw
+        return raw
+    
+    def reset_trace_id(self):
+        """原地生成新的 TraceID 并重置创建时间（复用 Context 对象处理下一个请求时使用）"""
+        self._trace_id = None
+        self._trace_id_bytes = self._generate_trace_id_bytes()
+        self._created_ns = time.time_ns()
+    
+    @property
+    def created_at(self) -> float:
+        """创建时间（Unix 时间戳，秒）"""
+        return self._created_ns / 1e9
+    
+    @staticmethod
+    def _generate_trace_id_bytes() -> bytes:
+        """生成 16 字节的 TraceID 原始值"""
+        try:
+            buf = getattr(_tls, 'buf', None)
+            off = getattr(_tls, 'off', 0)
+            if buf is None or off >= _TRACE_ID_POOL_SIZE:
+                buf = _tls.buf = os.urandom(_TRACE_ID_POOL_SIZE)
+                off = 0
+            _tls.off = off + _TRACE_ID_BYTES
+            return buf[off:off + _TRACE_ID_BYTES]
+        except Exception:
+            return os.urandom(_TRACE_ID_BYTES)
     
     def _generate_trace_id(self) -> str:
         """生成 TraceID"""
-        return str(uuid.uuid4()).replace('-', '')
+        return self._generate_trace_id_bytes().hex()
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -49,8 +128,80 @@ class Context:
         return self.__str__()
 
 
+# 未设置上下文时使用的哨兵 TraceID（全 0），日志聚合时可据此过滤
+NULL_TRACE_ID = '0' * 32
+
+# 哨兵上下文：作为 ContextVar 的默认值，读取时无需分支或异常处理。
+# 对外的 get_current_context()/get_trace_id() 仍在未设置时返回 None
+_NULL_CTX = Context(trace_id=NULL_TRACE_ID)
+
+# 头部采样率（环境变量 TRACE_SAMPLE_RATE，取值 0~1，默认 1 即全部采样）。
+# 未被采样的请求不生成随机 TraceID，使用 TraceID 为 NULL_TRACE_ID 的新上下文
+try:
+    _TRACE_SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', '1'))
+except ValueError:
+    logger.warning("TRACE_SAMPLE_RATE 不是合法数字，使用默认值 1")
+    _TRACE_SAMPLE_RATE = 1.0
+
+# 全局上下文变量
+_context_var: contextvars.ContextVar = contextvars.ContextVar('request_context', default=_NULL_CTX)
+
+# 预先绑定 get/set 方法，热路径上省去每次的属性查找和绑定方法创建。
+# 读写仍全部经过同一个 ContextVar，线程和协程之间的隔离语义不变
+_get_context = _context_var.get
+_set_context = _context_var.set
+
+
+def _new_context(trace_id: Union[str, bytes, None] = None) -> Context:
+    """
+    新建上下文（不设置为当前上下文）
+    
+    未指定 trace_id 时按 TRACE_SAMPLE_RATE 采样：未被采样时返回 TraceID 为 NULL_TRACE_ID 的新上下文，
+    每次都是独立的对象，不会与其他请求共享
+    """
+    if not trace_id and _TRACE_SAMPLE_RATE < 1.0 and random.random() >= _TRACE_SAMPLE_RATE:
+        return Context(trace_id=NULL_TRACE_ID)
+    return Context(trace_id=trace_id)
+
+
+def _context_from_request(request) -> Context:
+    """从 HTTP 请求构建上下文（不设置为当前上下文）"""
+    headers = getattr(request, 'headers', None)
+    if headers is None:
+        return _new_context()
+    
+    # Flask/Django/Starlette 的 headers 均大小写不敏感，一次查找即可；
+    # 仅普通 dict 需要再尝试小写键
+    trace_id = headers.get('X-Trace-Id')
+    if trace_id is None and type(headers) is dict:
+        trace_id = headers.get('x-trace-id')
+    
+    return _new_context(trace_id)
+
+
+def _context_from_grpc(grpc_context) -> Context:
+    """从 gRPC 上下文构建上下文（不设置为当前上下文）"""
+    trace_id = None
+    fallback = None
+    
+    # 尝试从 gRPC 元数据获取 TraceID：直接遍历元数据，无需构建 dict；
+    # x-trace-id 优先，找到即停止，trace-id 仅作为兜底
+    try:
+        for key, value in grpc_context.invocation_metadata():
+            if key == 'x-trace-id':
+                if value:
+                    trace_id = value
+                    break
+            elif key == 'trace-id' and fallback is None:
+                fallback = value
+    except Exception:
+        pass
+    
+    return _new_context(trace_id or fallback)
+
+
 class ContextManager:
-    """上下文管理器"""
+    """上下文管理器（保留以兼容旧代码，方法均委托给模块级函数）"""
     
     def __init__(self):
         self.initialized = False
@@ -68,69 +219,46 @@ class ContextManager:
     
     def get_current_context(self) -> Optional[Context]:
         """获取当前上下文"""
-        try:
-            return _context_var.get()
-        except LookupError:
-            return None
+        return get_current_context()
     
-    def set_context(self, context: Context):
+    def set_context(self, context: Context) -> contextvars.Token:
         """设置当前上下文"""
-        _context_var.set(context)
+        return set_context(context)
     
     def get_trace_id(self) -> Optional[str]:
         """获取当前 TraceID"""
-        context = self.get_current_context()
-        return context.trace_id if context else None
+        return get_trace_id()
     
     def create_context_from_request(self, request) -> Context:
         """从 HTTP 请求创建上下文"""
-        trace_id = None
-        
-        # 尝试从请求头获取 TraceID
-        if hasattr(request, 'headers'):
-            trace_id = request.headers.get('X-Trace-Id') or request.headers.get('x-trace-id')
-        
-        return Context(trace_id=trace_id)
+        return _context_from_request(request)
     
     def create_context_from_grpc(self, grpc_context) -> Context:
         """从 gRPC 上下文创建上下文"""
-        trace_id = None
-        
-        # 尝试从 gRPC 元数据获取 TraceID
-        try:
-            metadata = dict(grpc_context.invocation_metadata())
-            trace_id = metadata.get('x-trace-id') or metadata.get('trace-id')
-        except Exception:
-            pass
-        
-        return Context(trace_id=trace_id)
+        return _context_from_grpc(grpc_context)
 
 
-# 全局上下文管理器实例
-_context_manager: Optional[ContextManager] = None
+# 全局上下文管理器实例（无状态，导入时直接创建）
+_context_manager: ContextManager = ContextManager()
+_context_manager.init()
 
 
 def init_context_manager():
-    """初始化全局上下文管理器"""
-    global _context_manager
-    if _context_manager is None:
-        _context_manager = ContextManager()
-        _context_manager.init()
+    """初始化全局上下文管理器（已在导入时完成，保留以兼容旧代码）"""
+    _context_manager.init()
 
 
 def get_context_manager() -> ContextManager:
     """获取全局上下文管理器"""
-    if _context_manager is None:
-        init_context_manager()
     return _context_manager
 
 
-def create_context(trace_id: str = None) -> Context:
+def create_context(trace_id: Union[str, bytes, None] = None) -> Context:
     """
     创建新的上下文（自动生成 TraceID）
     
     Args:
-        trace_id: 可选的 TraceID，如果不提供则自动生成
+        trace_id: 可选的 TraceID（字符串或 16 字节原始值），如果不提供则自动生成
         
     Returns:
         新创建的上下文
@@ -141,13 +269,75 @@ def create_context(trace_id: str = None) -> Context:
         
         >>> ctx = create_context("custom-trace-id")
         >>> print(ctx.trace_id)  # custom-trace-id
+    
+    Note:
+        如果指定的 trace_id 与当前上下文一致（例如嵌套处理、重试），
+        直接返回当前上下文，不会重新创建。
+        
+        设置了 TRACE_SAMPLE_RATE（小于 1）时，未指定 trace_id 的调用按该比例采样，
+        未被采样时返回 trace_id 为 NULL_TRACE_ID 的新上下文。
+    """
+    if trace_id is not None:
+        current = _get_context()
+        current_id = current.trace_id_bytes if isinstance(trace_id, bytes) else current.trace_id
+        if current_id == trace_id and current is not _NULL_CTX:
+            return current
+    
+    context = _new_context(trace_id)
+    _set_context(context)
+    return context
+
+
+def reset_trace_id(context: Context) -> Context:
+    """
+    为已有的上下文原地生成新的 TraceID
+    
+    循环处理大量请求时，可以每个线程只创建一个上下文，每个请求开始时重置其 TraceID，
+    避免为每个请求分配新的 Context 对象。
+    
+    Args:
+        context: 要重置的上下文
+        
+    Returns:
+        重置后的上下文（即传入的对象）
+        
+    Example:
+        >>> ctx = create_context()
+        >>> for item in items:
+        >>>     reset_trace_id(ctx)
+        >>>     logger.info("处理请求", context=ctx)
+    
+    Note:
+        已经交给其他线程或后台任务的上下文不要重置，否则它们记录的 TraceID 会随之改变。
     """
-    manager = get_context_manager()
-    context = manager.create_context(trace_id=trace_id)
-    manager.set_context(context)
+    if context is None:
+        raise ValueError("context 参数是必需的，不能为 None")
+    if context is _NULL_CTX:
+        raise ValueError("不能重置未设置上下文时使用的哨兵上下文")
+    
+    context.reset_trace_id()
     return context
 
 
+def new_span() -> int:
+    """
+    生成一个 64 位的 span ID
+    
+    同一业务流程内的多个子步骤可以共享一个根上下文（同一 TraceID），
+    每个步骤只生成轻量的 span ID 加以区分，无需再创建新的上下文。
+    
+    Returns:
+        64 位无符号整数 span ID
+        
+    Example:
+        >>> ctx = create_context()
+        >>> for step in steps:
+        >>>     span_id = new_span()
+        >>>     logger.info("执行步骤", span_id=f"{span_id:016x}")
+    """
+    return random.getrandbits(64)
+
+
 def get_current_context() -> Optional[Context]:
     """
     获取当前上下文
@@ -160,23 +350,39 @@ def get_current_context() -> Optional[Context]:
         >>> if ctx:
         >>>     print(f"TraceID: {ctx.trace_id}")
     """
-    manager = get_context_manager()
-    return manager.get_current_context()
+    context = _get_context()
+    return None if context is _NULL_CTX else context
 
 
-def set_context(context: Context):
+def set_context(context: Context) -> contextvars.Token:
     """
     设置当前上下文
     
     Args:
         context: 要设置的上下文
         
+    Returns:
+        ContextVar 令牌，可传给 reset_context() 恢复设置前的上下文
+        
     Example:
-        >>> ctx = Context(user_id="123")
-        >>> set_context(ctx)
+        >>> ctx = Context(trace_id="custom-trace-id")
+        >>> token = set_context(ctx)
+        >>> try:
+        >>>     ...  # 处理请求
+        >>> finally:
+        >>>     reset_context(token)
+    """
+    return _set_context(context)
+
+
+def reset_context(token: contextvars.Token):
+    """
+    恢复 set_context() 之前的上下文（包括"未设置"状态）
+    
+    Args:
+        token: set_context() 返回的令牌
     """
-    manager = get_context_manager()
-    manager.set_context(context)
+    _context_var.reset(token)
 
 
 def get_trace_id() -> Optional[str]:
@@ -190,8 +396,8 @@ def get_trace_id() -> Optional[str]:
         >>> trace_id = get_trace_id()
         >>> print(f"当前 TraceID: {trace_id}")
     """
-    manager = get_context_manager()
-    return manager.get_trace_id()
+    context = _get_context()
+    return None if context is _NULL_CTX else context.trace_id
 
 
 def create_context_from_request(request) -> Context:
@@ -210,9 +416,8 @@ def create_context_from_request(request) -> Context:
         >>> ctx = create_context_from_request(request)
         >>> set_context(ctx)
     """
-    manager = get_context_manager()
-    context = manager.create_context_from_request(request)
-    manager.set_context(context)
+    context = _context_from_request(request)
+    _set_context(context)
     return context
 
 
@@ -231,14 +436,12 @@ def create_context_from_grpc(grpc_context) -> Context:
         >>>     ctx = create_context_from_grpc(context)
         >>>     # 业务逻辑
     """
-    manager = get_context_manager()
-    context = manager.create_context_from_grpc(grpc_context)
-    manager.set_context(context)
+    context = _context_from_grpc(grpc_context)
+    _set_context(context)
     return context 
 
 
-@contextmanager
-def context_scope(trace_id: str = None):
+class _ContextScope:
     """
     上下文作用域管理器，进入时自动创建/设置 context，退出时恢复原 context。
     用于自动管理 traceID，无需业务手动传递。
@@ -247,20 +450,23 @@ def context_scope(trace_id: str = None):
         with context_scope():
             ... # 该作用域内 logger 自动带 traceID
     """
-    manager = get_context_manager()
-    prev_ctx = manager.get_current_context()
-    ctx = manager.create_context(trace_id=trace_id)
-    manager.set_context(ctx)
-    try:
-        yield ctx
-    finally:
-        if prev_ctx:
-            manager.set_context(prev_ctx)
-        else:
-            # 清空 contextvar
-            import contextvars
-            try:
-                _context_var = contextvars.ContextVar('request_context')
-                _context_var.set(None)
-            except Exception:
-                pass 
\ No newline at end of file
+    
+    __slots__ = ('_trace_id', '_token')
+    
+    def __init__(self, trace_id: str = None):
+        self._trace_id = trace_id
+        self._token = None
+    
+    def __enter__(self) -> Context:
+        ctx = Context(trace_id=self._trace_id)
+        self._token = _set_context(ctx)
+        return ctx
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 通过 token 精确恢复进入前的 context（包括"未设置"状态）
+        _context_var.reset(self._token)
+        self._token = None
+        return False
+
+
+context_scope = _ContextScope
@@ -1,28 +1,171 @@
+import asyncio
+import atexit
 import http.client
 import json
+import logging
+import threading
+from json.encoder import encode_basestring_ascii
+from typing import Dict, Optional, Tuple
+
+# 可选依赖：httpx（连接池，安装 h2 时启用 HTTP/2 多路复用）
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+logger = logging.getLogger("py_sdk.ding_bot")
+
+_BASE_URL = "https://oapi.dingtalk.com"
+_TIMEOUT = 5.0
+
+# 消息体中只有 content 会变化，预先拆出固定的前后缀，发送时只需转义 content
+_CONTENT_SENTINEL = "\x00content\x00"
+_PAYLOAD_HEAD, _PAYLOAD_TAIL = json.dumps({
+   "msgtype": "text",
+   "text": {
+      "content": _CONTENT_SENTINEL
+   },
+   "isAtAll": False
+}).split(json.dumps(_CONTENT_SENTINEL))
+
+_HEADERS = {
+   'Content-Type': 'application/json',
+   'Accept': '*/*',
+   'Host': 'oapi.dingtalk.com',
+   'Connection': 'keep-alive'
+}
+
+# httpx 自行管理 Host/Connection（HTTP/2 下也不允许携带 Connection 头）
+_HTTPX_HEADERS = {
+   'Content-Type': 'application/json',
+   'Accept': '*/*'
+}
+
+# 所有 DingBot 实例共享的 httpx 客户端（按需创建）；
+# AsyncClient 绑定在创建它的事件循环上，按事件循环分别创建（以 id 为键），事件循环关闭后清理
+_client: Optional["httpx.Client"] = None
+_async_clients: Dict[int, Tuple[asyncio.AbstractEventLoop, "httpx.AsyncClient"]] = {}
+_client_lock = threading.Lock()
+
+
+def _get_client() -> "httpx.Client":
+   global _client
+   if _client is None:
+      with _client_lock:
+         if _client is None:
+            _client = httpx.Client(base_url=_BASE_URL, http2=_HTTP2, timeout=_TIMEOUT)
+            atexit.register(close_client)
+   return _client
+
+
+def close_client() -> None:
+   """关闭共享的同步 httpx 客户端（进程退出时自动调用）"""
+   global _client
+   with _client_lock:
+      client, _client = _client, None
+   if client is not None:
+      client.close()
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+   loop = asyncio.get_running_loop()
+   entry = _async_clients.get(id(loop))
+   if entry is None:
+      with _client_lock:
+         # 事件循环已关闭的客户端既不能再使用也无法 aclose，直接丢弃
+         for key in [key for key, (old_loop, _) in _async_clients.items() if old_loop.is_closed()]:
+            del _async_clients[key]
+         entry = _async_clients.get(id(loop))
+         if entry is None:
+            client = httpx.AsyncClient(base_url=_BASE_URL, http2=_HTTP2, timeout=_TIMEOUT)
+            entry = _async_clients[id(loop)] = (loop, client)
+   return entry[1]
+
+
+async def aclose_clients() -> None:
+   """关闭当前事件循环上的 AsyncClient，应在事件循环结束前调用（如 FastAPI 的 shutdown 事件）"""
+   loop = asyncio.get_running_loop()
+   with _client_lock:
+      entry = _async_clients.pop(id(loop), None)
+   if entry is not None:
+      await entry[1].aclose()
+
+
+def _log_response(status: int, data: bytes) -> None:
+   # 仅在需要时才解码响应体
+   if status != 200:
+      logger.warning("DingBot 发送失败: status=%s, body=%s", status, data.decode("utf-8", "replace"))
+      return
+   # 钉钉对被拒绝的消息（关键词不匹配、限流等）同样返回 200，需检查响应中的 errcode
+   try:
+      errcode = json.loads(data).get("errcode", 0)
+   except (ValueError, AttributeError):
+      errcode = None
+   if errcode != 0:
+      logger.warning("DingBot 发送失败: errcode=%s, body=%s", errcode, data.decode("utf-8", "replace"))
+   elif logger.isEnabledFor(logging.DEBUG):
+      logger.debug("DingBot 响应: %s", data.decode("utf-8", "replace"))
+
 
 class DingBot:
     def __init__(self,token:str, prefix:str):
         self.token = token
         self.prefix = prefix
-    def dingBotSendMsg(self, msg: str):
-       conn = http.client.HTTPSConnection("oapi.dingtalk.com")
-       body = {
-          "msgtype": "text",
-          "text": {
-             "content": f'{self.prefix}{msg}'
-          },
-          "isAtAll": False
-       }
-       payload = json.dumps(body)
-       headers = {
-          'Content-Type': 'application/json',
-          'Accept': '*/*',
-          'Host': 'oapi.dingtalk.com',
-          'Connection': 'keep-alive'
-       }
-       conn.request("POST", f"/robot/send?access_token={self.token}", payload, headers)
+        self._path = f"/robot/send?access_token={token}"
+        # 未安装 httpx 时，复用同一条 HTTPS 连接（keep-alive），避免每条消息都做一次 TLS 握手
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._lock = threading.Lock()
+    def _build_payload(self, msg: str) -> str:
+       return _PAYLOAD_HEAD + encode_basestring_ascii(f'{self.prefix}{msg}') + _PAYLOAD_TAIL
+    def _get_conn(self) -> http.client.HTTPSConnection:
+       if self._conn is None:
+          self._conn = http.client.HTTPSConnection("oapi.dingtalk.com", timeout=_TIMEOUT)
+       return self._conn
+    def _reset_conn(self) -> None:
+       if self._conn is not None:
+          self._conn.close()
+          self._conn = None
+    def _request(self, payload: str) -> Tuple[int, bytes]:
+       conn = self._get_conn()
+       conn.request("POST", self._path, payload, _HEADERS)
        res = conn.getresponse()
-       data = res.read()
-       print(data.decode("utf-8"))
-
+       # 响应体必须读完连接才能复用
+       return res.status, res.read()
+    def _send_with_http_client(self, payload: str) -> None:
+       with self._lock:
+          try:
+             status, data = self._request(payload)
+          except (BrokenPipeError, ConnectionResetError, http.client.RemoteDisconnected):
+             # 服务端已关闭空闲连接，重建后重试一次
+             self._reset_conn()
+             try:
+                status, data = self._request(payload)
+             except Exception:
+                self._reset_conn()
+                raise
+          except Exception:
+             self._reset_conn()
+             raise
+       _log_response(status, data)
+    def dingBotSendMsg(self, msg: str) -> None:
+       payload = self._build_payload(msg)
+       if httpx is None:
+          self._send_with_http_client(payload)
+          return
+       res = _get_client().post(self._path, content=payload, headers=_HTTPX_HEADERS)
+       _log_response(res.status_code, res.content)
+    async def dingBotSendMsgAsync(self, msg: str) -> None:
+       """异步发送消息；未安装 httpx 时在线程池中执行同步发送"""
+       payload = self._build_payload(msg)
+       if httpx is None:
+          loop = asyncio.get_running_loop()
+          await loop.run_in_executor(None, self._send_with_http_client, payload)
+          return
+       res = await _get_async_client().post(self._path, content=payload, headers=_HTTPX_HEADERS)
+       _log_response(res.status_code, res.content)
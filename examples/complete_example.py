@@ -10,12 +10,74 @@ py_sdk 完整使用示例
 - nacos_sdk: 服务注册发现和配置管理
 """
 
+import asyncio
+import io
+import logging
 import os
+import sys
 import time
-from context import create_context
+from collections import namedtuple
+from contextlib import contextmanager, redirect_stdout
+from context import create_context, new_span
 from logger import init_logger_manager, get_logger
 from http_client import create_response, OK, INVALID_PARAMS, BusinessCode
-from nacos_sdk import registerNacos, unregisterNacos, get_config
+from nacos_sdk import registerNacos, unregisterNacos, get_config_async
+
+# 日志记录器和自定义业务状态码只需创建一次，在请求处理中复用
+_API_LOGGER = get_logger("api")
+_HANDLER_LOGGER = get_logger("handler")
+
+USER_NOT_FOUND = BusinessCode(
+    code=20001,
+    message="用户不存在",
+    i18n="user_not_found"
+)
+
+# 演示数据：模块加载时构建一次的不可变记录
+ApiRequest = namedtuple("ApiRequest", "method path user_id data")
+Service = namedtuple("Service", "name operation")
+
+# 模拟处理不同的 API 请求
+API_REQUESTS = (
+    ApiRequest("GET", "/users/123", 123, None),
+    ApiRequest("POST", "/users", 0, {"name": "张三", "email": "zhangsan@example.com"}),
+    ApiRequest("GET", "/users/0", 0, None),  # 参数错误
+    ApiRequest("GET", "/users/999", 999, None)  # 用户不存在
+)
+
+SERVICES = (
+    Service("user-service", "获取用户信息"),
+    Service("order-service", "创建订单"),
+    Service("payment-service", "处理支付"),
+    Service("notification-service", "发送通知")
+)
+
+
+def log(logger, level, message, **extra):
+    """结构化日志：级别未启用时直接返回，跳过 SDKLogger 和 LogRecord 的构建开销"""
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra=extra)
+
+
+@contextmanager
+def output_section(title):
+    """
+    输出一个演示章节：非终端输出（重定向到文件/管道）时先缓冲本节所有 print，
+    结束时一次性写出，避免逐行写入；终端下保持逐行输出
+    """
+    if sys.stdout.isatty():
+        print(title)
+        yield
+        return
+    
+    buffer = io.StringIO()
+    buffer.write(title + "\n")
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 
 def main():
@@ -23,7 +85,7 @@ def main():
     print("🎯 py_sdk 完整使用示例")
     print("=" * 60)
     
-    # 1. 初始化系统
+    # 1. 初始化系统（不缓冲输出：日志处理器在此创建，需绑定真实的 stdout）
     print("\n📋 1. 系统初始化")
     initialize_system()
     
@@ -32,16 +94,16 @@ def main():
     service_info = register_service()
     
     # 3. 配置管理
-    print("\n📋 3. 配置管理")
-    config = load_configuration()
+    with output_section("\n📋 3. 配置管理"):
+        config = load_configuration()
     
     # 4. 模拟 Web API 服务
-    print("\n📋 4. 模拟 Web API 服务")
-    simulate_web_api_service(config)
+    with output_section("\n📋 4. 模拟 Web API 服务"):
+        simulate_web_api_service(config)
     
     # 5. 模拟微服务调用
-    print("\n📋 5. 模拟微服务调用")
-    simulate_microservice_calls()
+    with output_section("\n📋 5. 模拟微服务调用"):
+        simulate_microservice_calls()
     
     # 6. 清理资源
     print("\n📋 6. 清理资源")
@@ -77,10 +139,10 @@ def initialize_system():
     logger = get_logger("system")
     ctx = create_context()
     
-    logger.info( "系统初始化完成", extra={
-        "components": ["context", "logger", "http_client", "nacos_sdk"],
-        "version": "1.0.0"
-    })
+    log(logger, logging.INFO, "系统初始化完成",
+        components=["context", "logger", "http_client", "nacos_sdk"],
+        version="1.0.0"
+    )
     
     print("✅ 系统组件初始化完成")
 
@@ -96,7 +158,7 @@ def register_service():
         "version": "1.0.0"
     }
     
-    logger.info( "开始注册服务", extra=service_info)
+    log(logger, logging.INFO, "开始注册服务", **service_info)
     
     success = registerNacos(
         service_name=service_info["name"],
@@ -132,21 +194,29 @@ def load_configuration():
         "app": ("application.properties", "DEFAULT_GROUP")
     }
     
+    # 并发拉取所有配置（get_config_async 不阻塞事件循环）
+    async def fetch_all():
+        return await asyncio.gather(*(
+            get_config_async(data_id, group)
+            for data_id, group in config_items.values()
+        ))
+    
+    config_values = asyncio.run(fetch_all())
+    
     config = {}
-    for key, (data_id, group) in config_items.items():
-        config_value = get_config(data_id, group)
+    for (key, (data_id, group)), config_value in zip(config_items.items(), config_values):
         if config_value:
             config[key] = config_value
-            logger.info( "配置加载成功", extra={
-                "config_key": key,
-                "data_id": data_id
-            })
+            log(logger, logging.INFO, "配置加载成功",
+                config_key=key,
+                data_id=data_id
+            )
             print(f"   ✅ {key} 配置加载成功")
         else:
-            logger.warning( "配置不存在", extra={
-                "config_key": key,
-                "data_id": data_id
-            })
+            log(logger, logging.WARNING, "配置不存在",
+                config_key=key,
+                data_id=data_id
+            )
             print(f"   ⚠️  {key} 配置不存在，使用默认配置")
     
     # 使用默认配置
@@ -164,55 +234,45 @@ def load_configuration():
 
 def simulate_web_api_service(config):
     """模拟 Web API 服务"""
-    logger = get_logger("api")
-    
-    # 模拟处理不同的 API 请求
-    api_requests = [
-        {"method": "GET", "path": "/users/123", "user_id": 123},
-        {"method": "POST", "path": "/users", "data": {"name": "张三", "email": "zhangsan@example.com"}},
-        {"method": "GET", "path": "/users/0", "user_id": 0},  # 参数错误
-        {"method": "GET", "path": "/users/999", "user_id": 999}  # 用户不存在
-    ]
-    
-    for request in api_requests:
-        ctx = create_context()
+    logger = _API_LOGGER
+    
+    # 整批请求共享一个根上下文，每个请求只生成轻量的 span ID
+    ctx = create_context()
+    
+    for request in API_REQUESTS:
+        span_id = new_span()
         
-        logger.info( "收到 API 请求", extra={
-            "method": request["method"],
-            "path": request["path"],
-            "user_agent": "py_sdk_demo/1.0.0"
-        })
+        log(logger, logging.INFO, "收到 API 请求",
+            span_id=span_id,
+            method=request.method,
+            path=request.path,
+            user_agent="py_sdk_demo/1.0.0"
+        )
         
         # 处理请求
-        response = handle_api_request(ctx, request)
+        response = handle_api_request(ctx, request, span_id)
         
-        logger.info( "API 请求处理完成", extra={
-            "method": request["method"],
-            "path": request["path"],
-            "response_code": response.code,
-            "success": response.is_success()
-        })
+        log(logger, logging.INFO, "API 请求处理完成",
+            span_id=span_id,
+            method=request.method,
+            path=request.path,
+            response_code=response.code,
+            success=response.is_success()
+        )
         
-        print(f"   📤 {request['method']} {request['path']} -> {response.code}")
+        print(f"   📤 {request.method} {request.path} -> {response.code}")
 
 
-def handle_api_request(ctx, request):
+def handle_api_request(ctx, request, span_id=None):
     """处理 API 请求"""
-    logger = get_logger("handler")
+    logger = _HANDLER_LOGGER
     
-    # 自定义业务状态码
-    USER_NOT_FOUND = BusinessCode(
-        code=20001,
-        message="用户不存在",
-        i18n="user_not_found"
-    )
-    
-    if request["method"] == "GET" and "/users/" in request["path"]:
-        user_id = request.get("user_id", 0)
+    if request.method == "GET" and "/users/" in request.path:
+        user_id = request.user_id
         
         # 参数验证
         if user_id <= 0:
-            logger.warning( "参数验证失败", extra={"user_id": user_id})
+            log(logger, logging.WARNING, "参数验证失败", span_id=span_id, user_id=user_id)
             return create_response(
                 context=ctx,
                 code=INVALID_PARAMS,
@@ -221,7 +281,7 @@ def handle_api_request(ctx, request):
         
         # 模拟业务逻辑
         if user_id == 999:
-            logger.warning( "用户不存在", extra={"user_id": user_id})
+            log(logger, logging.WARNING, "用户不存在", span_id=span_id, user_id=user_id)
             return create_response(
                 context=ctx,
                 code=USER_NOT_FOUND,
@@ -230,19 +290,19 @@ def handle_api_request(ctx, request):
         
         # 成功响应
         user_data = {"id": user_id, "name": "张三", "status": "active"}
-        logger.info( "用户信息获取成功", extra={"user_id": user_id})
+        log(logger, logging.INFO, "用户信息获取成功", span_id=span_id, user_id=user_id)
         return create_response(
             context=ctx,
             code=OK,
             data=user_data
         )
     
-    elif request["method"] == "POST" and request["path"] == "/users":
+    elif request.method == "POST" and request.path == "/users":
         # 创建用户
-        user_data = request.get("data", {})
+        user_data = request.data or {}
         new_user = {"id": 12345, **user_data, "created_at": time.time()}
         
-        logger.info( "用户创建成功", extra={"user_id": new_user["id"]})
+        log(logger, logging.INFO, "用户创建成功", span_id=span_id, user_id=new_user["id"])
         return create_response(
             context=ctx,
             code=OK,
@@ -257,62 +317,71 @@ def handle_api_request(ctx, request):
     )
 
 
-def simulate_microservice_calls():
-    """模拟微服务调用"""
+async def call_service(ctx, service, step, total_steps):
+    """调用单个微服务（协程）"""
     logger = get_logger("microservice")
     
-    services = [
-        {"name": "user-service", "operation": "获取用户信息"},
-        {"name": "order-service", "operation": "创建订单"},
-        {"name": "payment-service", "operation": "处理支付"},
-        {"name": "notification-service", "operation": "发送通知"}
-    ]
+    # 模拟服务调用
+    log(logger, logging.INFO, "调用微服务",
+        service_name=service.name,
+        operation=service.operation,
+        step=step,
+        total_steps=total_steps
+    )
+    
+    # 模拟处理时间（异步等待，不阻塞其他服务调用）
+    await asyncio.sleep(0.5)
     
-    # 模拟完整的业务流程
+    # 模拟响应
+    response = create_response(
+        context=ctx,
+        code=OK,
+        data={
+            "service": service.name,
+            "operation": service.operation,
+            "result": "success",
+            "timestamp": time.time()
+        }
+    )
+    
+    log(logger, logging.INFO, "微服务调用成功",
+        service_name=service.name,
+        response_code=response.code
+    )
+    
+    print(f"   ✅ {service.name} - {service.operation}")
+    return response
+
+
+async def simulate_microservice_calls_async():
+    """模拟微服务调用（并发执行）"""
+    logger = get_logger("microservice")
+    
+    # 模拟完整的业务流程：各协程通过 contextvars 继承同一个上下文
     ctx = create_context()
-    logger.info( "开始业务流程", extra={
-        "flow_name": "order_processing",
-        "services_count": len(services)
-    })
-    
-    for i, service in enumerate(services, 1):
-        # 模拟服务调用
-        logger.info( "调用微服务", extra={
-            "service_name": service["name"],
-            "operation": service["operation"],
-            "step": i,
-            "total_steps": len(services)
-        })
-        
-        # 模拟处理时间
-        time.sleep(0.5)
-        
-        # 模拟响应
-        response = create_response(
-            context=ctx,
-            code=OK,
-            data={
-                "service": service["name"],
-                "operation": service["operation"],
-                "result": "success",
-                "timestamp": time.time()
-            }
-        )
-        
-        logger.info( "微服务调用成功", extra={
-            "service_name": service["name"],
-            "response_code": response.code
-        })
-        
-        print(f"   ✅ {service['name']} - {service['operation']}")
+    log(logger, logging.INFO, "开始业务流程",
+        flow_name="order_processing",
+        services_count=len(SERVICES)
+    )
     
-    logger.info( "业务流程完成", extra={
-        "flow_name": "order_processing",
-        "status": "completed"
-    })
+    total_steps = len(SERVICES)
+    await asyncio.gather(*(
+        call_service(ctx, service, i, total_steps)
+        for i, service in enumerate(SERVICES, 1)
+    ))
+    
+    log(logger, logging.INFO, "业务流程完成",
+        flow_name="order_processing",
+        status="completed"
+    )
     print("   🎉 完整业务流程执行成功")
 
 
+def simulate_microservice_calls():
+    """模拟微服务调用"""
+    asyncio.run(simulate_microservice_calls_async())
+
+
 def cleanup_resources(service_info):
     """清理资源"""
     logger = get_logger("cleanup")
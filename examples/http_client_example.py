@@ -7,6 +7,8 @@ HTTP 客户端模块示例
 包括成功响应、错误响应、自定义状态码等功能。
 """
 
+from functools import partial
+
 from context import create_context
 from http_client import (
     create_response, 
@@ -18,6 +20,24 @@ from http_client import (
     INVALID_PARAMS
 )
 
+# 常用状态码的响应构造函数（预先绑定 code，处理请求时只需传入上下文和数据）
+ok_response = partial(create_response, code=OK)
+invalid_params_response = partial(create_response, code=INVALID_PARAMS)
+server_error_response = partial(create_response, code=INTERNAL_SERVER_ERROR)
+
+# 自定义业务状态码：在模块加载时创建一次，各处理函数直接复用
+USER_NOT_FOUND = BusinessCode(20001, "用户不存在", "user_not_found")
+INSUFFICIENT_BALANCE = BusinessCode(20002, "余额不足", "insufficient_balance")
+ORDER_EXPIRED = BusinessCode(20003, "订单已过期", "order_expired")
+PRODUCT_OUT_OF_STOCK = BusinessCode(20004, "商品库存不足", "product_out_of_stock")
+
+# 支付相关状态码
+PAYMENT_FAILED = BusinessCode(30001, "支付失败", "payment_failed")
+PAYMENT_INSUFFICIENT_BALANCE = BusinessCode(30002, "余额不足", "insufficient_balance")
+
+# 库存相关状态码
+INSUFFICIENT_STOCK = BusinessCode(40001, "库存不足", "insufficient_stock")
+
 
 def main():
     """主函数"""
@@ -124,12 +144,6 @@ def custom_business_code():
     """自定义业务状态码示例"""
     print("创建自定义业务状态码...")
     
-    # 定义自定义业务状态码
-    USER_NOT_FOUND = BusinessCode(20001, "用户不存在", "user_not_found")
-    INSUFFICIENT_BALANCE = BusinessCode(20002, "余额不足", "insufficient_balance")
-    ORDER_EXPIRED = BusinessCode(20003, "订单已过期", "order_expired")
-    PRODUCT_OUT_OF_STOCK = BusinessCode(20004, "商品库存不足", "product_out_of_stock")
-    
     ctx = create_context()
     
     # 使用自定义状态码
@@ -194,9 +208,8 @@ def user_query_api():
     try:
         # 模拟参数验证
         if user_id <= 0:
-            response = create_response(
+            response = invalid_params_response(
                 context=ctx,
-                code=INVALID_PARAMS,
                 data={"field": "user_id", "message": "用户ID必须大于0"}
             )
             print(f"    参数错误: {response.to_dict()}")
@@ -211,9 +224,8 @@ def user_query_api():
         }
         
         # 成功响应
-        response = create_response(
+        response = ok_response(
             context=ctx,
-            code=OK,
             data=user_data
         )
         
@@ -221,10 +233,7 @@ def user_query_api():
         
     except Exception as e:
         # 异常响应
-        error_response = create_response(
-            context=ctx,
-            code=INTERNAL_SERVER_ERROR
-        )
+        error_response = server_error_response(context=ctx)
         print(f"    系统异常: {error_response.to_dict()}")
 
 
@@ -246,9 +255,8 @@ def order_create_api():
         }
         
         # 成功响应
-        response = create_response(
+        response = ok_response(
             context=ctx,
-            code=OK,
             data=order_data
         )
         
@@ -256,10 +264,7 @@ def order_create_api():
         
     except Exception as e:
         # 异常响应
-        error_response = create_response(
-            context=ctx,
-            code=INTERNAL_SERVER_ERROR
-        )
+        error_response = server_error_response(context=ctx)
         print(f"    创建失败: {error_response.to_dict()}")
 
 
@@ -269,10 +274,6 @@ def payment_process_api():
     
     ctx = create_context()
     
-    # 定义支付相关状态码
-    PAYMENT_FAILED = BusinessCode(30001, "支付失败", "payment_failed")
-    INSUFFICIENT_BALANCE = BusinessCode(30002, "余额不足", "insufficient_balance")
-    
     try:
         # 模拟余额检查
         user_balance = 50.00
@@ -281,7 +282,7 @@ def payment_process_api():
         if user_balance < payment_amount:
             response = create_response(
                 context=ctx,
-                code=INSUFFICIENT_BALANCE,
+                code=PAYMENT_INSUFFICIENT_BALANCE,
                 data={
                     "required_amount": payment_amount,
                     "current_balance": user_balance,
@@ -301,9 +302,8 @@ def payment_process_api():
             "transaction_id": "TXN-123456789"
         }
         
-        response = create_response(
+        response = ok_response(
             context=ctx,
-            code=OK,
             data=payment_data
         )
         
@@ -323,29 +323,29 @@ def microservice_call_example():
     """微服务调用示例"""
     print("模拟微服务调用...")
     
+    # 整条调用链共享同一个上下文（同一 TraceID），由入口创建后逐层传递
+    ctx = create_context()
+    
     # 模拟用户服务调用
-    user_service_call()
+    user_service_call(ctx)
     
     # 模拟订单服务调用
-    order_service_call()
+    order_service_call(ctx)
     
     # 模拟库存服务调用
-    inventory_service_call()
+    inventory_service_call(ctx)
 
 
-def user_service_call():
+def user_service_call(ctx):
     """用户服务调用示例"""
     print("\n  调用用户服务:")
     
-    ctx = create_context()
-    
-    def get_user_info(user_id):
+    def get_user_info(ctx, user_id):
         """获取用户信息"""
         try:
             if user_id == 12345:
-                return create_response(
+                return ok_response(
                     context=ctx,
-                    code=OK,
                     data={
                         "id": user_id,
                         "name": "张三",
@@ -354,33 +354,27 @@ def user_service_call():
                     }
                 )
             else:
-                USER_NOT_FOUND = BusinessCode(20001, "用户不存在", "user_not_found")
                 return create_response(
                     context=ctx,
                     code=USER_NOT_FOUND,
                     data={"user_id": user_id}
                 )
         except Exception:
-            return create_response(
-                context=ctx,
-                code=INTERNAL_SERVER_ERROR
-            )
+            return server_error_response(context=ctx)
     
     # 调用用户服务
-    response = get_user_info(12345)
+    response = get_user_info(ctx, 12345)
     print(f"    用户信息查询: {response.to_dict()}")
     
-    response = get_user_info(99999)
+    response = get_user_info(ctx, 99999)
     print(f"    用户不存在: {response.to_dict()}")
 
 
-def order_service_call():
+def order_service_call(ctx):
     """订单服务调用示例"""
     print("\n  调用订单服务:")
     
-    ctx = create_context()
-    
-    def create_order(user_id, product_id, quantity):
+    def create_order(ctx, user_id, product_id, quantity):
         """创建订单"""
         try:
             order_data = {
@@ -393,38 +387,31 @@ def order_service_call():
                 "status": "pending"
             }
             
-            return create_response(
+            return ok_response(
                 context=ctx,
-                code=OK,
                 data=order_data
             )
         except Exception:
-            return create_response(
-                context=ctx,
-                code=INTERNAL_SERVER_ERROR
-            )
+            return server_error_response(context=ctx)
     
     # 调用订单服务
-    response = create_order(12345, "PROD-001", 2)
+    response = create_order(ctx, 12345, "PROD-001", 2)
     print(f"    订单创建: {response.to_dict()}")
 
 
-def inventory_service_call():
+def inventory_service_call(ctx):
     """库存服务调用示例"""
     print("\n  调用库存服务:")
     
-    ctx = create_context()
-    
-    def check_inventory(product_id, quantity):
+    def check_inventory(ctx, product_id, quantity):
         """检查库存"""
         try:
             # 模拟库存检查
             available_stock = 5
             
             if available_stock >= quantity:
-                return create_response(
+                return ok_response(
                     context=ctx,
-                    code=OK,
                     data={
                         "product_id": product_id,
                         "available_stock": available_stock,
@@ -433,7 +420,6 @@ def inventory_service_call():
                     }
                 )
             else:
-                INSUFFICIENT_STOCK = BusinessCode(40001, "库存不足", "insufficient_stock")
                 return create_response(
                     context=ctx,
                     code=INSUFFICIENT_STOCK,
@@ -445,16 +431,13 @@ def inventory_service_call():
                     }
                 )
         except Exception:
-            return create_response(
-                context=ctx,
-                code=INTERNAL_SERVER_ERROR
-            )
+            return server_error_response(context=ctx)
     
     # 调用库存服务
-    response = check_inventory("PROD-001", 2)
+    response = check_inventory(ctx, "PROD-001", 2)
     print(f"    库存检查: {response.to_dict()}")
     
-    response = check_inventory("PROD-001", 10)
+    response = check_inventory(ctx, "PROD-001", 10)
     print(f"    库存不足: {response.to_dict()}")
 
 
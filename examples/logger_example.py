@@ -7,6 +7,7 @@
 结构化日志、异常处理等功能。
 """
 
+import logging
 import time
 from context import create_context
 from logger import init_logger_manager, logger
@@ -85,39 +86,39 @@ def structured_logging():
     # 创建上下文
     ctx = create_context()
 
-    # 用户登录日志
-    logger.info( "用户登录", extra={
-        "user_id": 12345,
-        "username": "john_doe",
-        "ip_address": "192.168.1.100",
-        "user_agent": "Mozilla/5.0..."
-    })
-    
-    # 订单创建日志
-    logger.info( "订单创建", extra={
-        "order_id": "ORD-2023-001",
-        "user_id": 12345,
-        "amount": 99.99,
-        "currency": "CNY",
-        "payment_method": "alipay"
-    })
-    
-    # API 调用日志
-    logger.info( "API 调用", extra={
-        "method": "GET",
-        "url": "/api/users/12345",
-        "status_code": 200,
-        "response_time": 150,
-        "user_id": 12345
-    })
-    
-    # 数据库操作日志
-    logger.info( "数据库查询", extra={
-        "table": "users",
-        "operation": "SELECT",
-        "query_time": 25,
-        "rows_affected": 1
-    })
+    # 同一级别的多条结构化日志可以批量记录（级别检查和上下文获取只做一次）
+    logger.log_bulk(logging.INFO, [
+        # 用户登录日志
+        ("用户登录", {
+            "user_id": 12345,
+            "username": "john_doe",
+            "ip_address": "192.168.1.100",
+            "user_agent": "Mozilla/5.0..."
+        }),
+        # 订单创建日志
+        ("订单创建", {
+            "order_id": "ORD-2023-001",
+            "user_id": 12345,
+            "amount": 99.99,
+            "currency": "CNY",
+            "payment_method": "alipay"
+        }),
+        # API 调用日志
+        ("API 调用", {
+            "method": "GET",
+            "url": "/api/users/12345",
+            "status_code": 200,
+            "response_time": 150,
+            "user_id": 12345
+        }),
+        # 数据库操作日志
+        ("数据库查询", {
+            "table": "users",
+            "operation": "SELECT",
+            "query_time": 25,
+            "rows_affected": 1
+        })
+    ], context=ctx)
     
     print("✓ 结构化日志记录完成")
 
@@ -180,14 +181,12 @@ def business_scenario():
 def user_registration_flow():
     """用户注册流程"""
     ctx = create_context()
-    logger.info( "用户注册流程开始", extra={
-        "flow": "user_registration",
-        "step": "start"
-    })
+    
+    # 各步骤信息先汇总，流程结束时只记录一条结构化日志
+    steps = []
     
     # 步骤1：参数验证
-    logger.info( "参数验证", extra={
-        "flow": "user_registration",
+    steps.append({
         "step": "validation",
         "email": "user@example.com",
         "username": "new_user"
@@ -196,8 +195,7 @@ def user_registration_flow():
     time.sleep(0.1)  # 模拟处理时间
     
     # 步骤2：检查用户是否存在
-    logger.info( "检查用户唯一性", extra={
-        "flow": "user_registration",
+    steps.append({
         "step": "uniqueness_check",
         "check_result": "passed"
     })
@@ -205,8 +203,7 @@ def user_registration_flow():
     time.sleep(0.1)
     
     # 步骤3：创建用户
-    logger.info( "创建用户记录", extra={
-        "flow": "user_registration",
+    steps.append({
         "step": "create_user",
         "user_id": 12345
     })
@@ -214,19 +211,19 @@ def user_registration_flow():
     time.sleep(0.1)
     
     # 步骤4：发送欢迎邮件
-    logger.info( "发送欢迎邮件", extra={
-        "flow": "user_registration",
+    steps.append({
         "step": "send_email",
         "email_type": "welcome",
         "user_id": 12345
     })
     
-    logger.info( "用户注册流程完成", extra={
-        "flow": "user_registration",
-        "step": "complete",
-        "user_id": 12345,
-        "total_time": 400
-    })
+    if logger.info_enabled:
+        logger.info( "用户注册流程完成", extra={
+            "flow": "user_registration",
+            "user_id": 12345,
+            "steps": steps,
+            "total_time": 400
+        })
 
 
 def order_processing_flow():
@@ -236,18 +233,12 @@ def order_processing_flow():
     order_id = "ORD-2023-001"
     user_id = 12345
     
-    logger.info("订单处理流程开始", extra={
-        "flow": "order_processing",
-        "step": "start",
-        "order_id": order_id,
-        "user_id": user_id
-    })
+    # 各步骤信息先汇总，流程结束时只记录一条结构化日志
+    steps = []
     
     # 步骤1：库存检查
-    logger.info( "库存检查", extra={
-        "flow": "order_processing",
+    steps.append({
         "step": "inventory_check",
-        "order_id": order_id,
         "product_id": "PROD-001",
         "quantity": 2,
         "available_stock": 10
@@ -256,10 +247,8 @@ def order_processing_flow():
     time.sleep(0.1)
     
     # 步骤2：价格计算
-    logger.info( "价格计算", extra={
-        "flow": "order_processing",
+    steps.append({
         "step": "price_calculation",
-        "order_id": order_id,
         "base_price": 99.99,
         "discount": 10.00,
         "final_price": 89.99
@@ -268,10 +257,8 @@ def order_processing_flow():
     time.sleep(0.1)
     
     # 步骤3：支付处理
-    logger.info( "支付处理", extra={
-        "flow": "order_processing",
+    steps.append({
         "step": "payment",
-        "order_id": order_id,
         "payment_method": "alipay",
         "amount": 89.99,
         "payment_status": "success"
@@ -280,10 +267,8 @@ def order_processing_flow():
     time.sleep(0.2)
     
     # 步骤4：库存扣减
-    logger.info( "库存扣减", extra={
-        "flow": "order_processing",
+    steps.append({
         "step": "inventory_deduction",
-        "order_id": order_id,
         "product_id": "PROD-001",
         "deducted_quantity": 2,
         "remaining_stock": 8
@@ -292,14 +277,15 @@ def order_processing_flow():
     time.sleep(0.1)
     
     # 步骤5：订单完成
-    logger.info( "订单处理完成", extra={
-        "flow": "order_processing",
-        "step": "complete",
-        "order_id": order_id,
-        "user_id": user_id,
-        "status": "completed",
-        "total_time": 500
-    })
+    if logger.info_enabled:
+        logger.info( "订单处理完成", extra={
+            "flow": "order_processing",
+            "order_id": order_id,
+            "user_id": user_id,
+            "status": "completed",
+            "steps": steps,
+            "total_time": 500
+        })
 
 
 if __name__ == "__main__":
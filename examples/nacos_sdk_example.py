@@ -7,15 +7,84 @@ Nacos SDK 模块示例
 包括服务注册、配置获取、健康检查等功能。
 """
 
+import logging
 import time
 import signal
 import sys
 import json
-import threading
-from nacos_sdk import registerNacos, unregisterNacos, get_config
-from context import create_context
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from nacos_sdk import (
+    registerNacos,
+    unregisterNacos,
+    get_config,
+    add_config_watcher,
+    remove_config_watcher
+)
+from nacos_sdk.client import get_nacos_client, get_local_ip
+from context import create_context, get_current_context
 from logger import init_logger_manager, get_logger
 
+# 可选依赖：orjson（C 实现，解析速度远高于标准库 json；其 JSONDecodeError 是 json.JSONDecodeError 的子类）
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# 以下常量在模块加载时创建一次，各示例函数直接复用
+
+# 示例中读取配置时可接受的本地缓存时长（秒）：缓存期内重复读取同一配置不再请求 Nacos，
+# 配置变化时由监听器（ConfigWatcher）推送的变更会同步刷新缓存
+CONFIG_CACHE_TTL = 30
+
+# 多服务注册示例中的服务列表
+SERVICES = [
+    {
+        "name": "user-service",
+        "port": 8081,
+        "metadata": {"module": "user", "version": "1.0.0"}
+    },
+    {
+        "name": "order-service",
+        "port": 8082,
+        "metadata": {"module": "order", "version": "1.0.0"}
+    },
+    {
+        "name": "payment-service",
+        "port": 8083,
+        "metadata": {"module": "payment", "version": "1.0.0"}
+    }
+]
+
+# app.json 不存在时使用的默认配置
+DEFAULT_APP_CONFIG = {
+    "database": {
+        "host": "localhost",
+        "port": 3306,
+        "name": "example_db"
+    },
+    "redis": {
+        "host": "localhost",
+        "port": 6379
+    },
+    "log_level": "INFO"
+}
+
+# 模拟的业务请求：请求 ID 和进度输出在模块加载时生成，循环中直接按下标取用
+SIMULATED_REQUESTS = 10
+REQUEST_IDS = tuple(f"REQ-{i+1:03d}" for i in range(SIMULATED_REQUESTS))
+PROGRESS_LINES = tuple(f"  处理请求 {i+1}/{SIMULATED_REQUESTS}" for i in range(SIMULATED_REQUESTS))
+
+# 业务请求日志批量记录的条数
+LOG_FLUSH_SIZE = 5
+
+# 需要监听变更的配置
+CONFIGS_TO_WATCH = [
+    ("app.json", "DEFAULT_GROUP"),
+    ("database.yml", "DEFAULT_GROUP"),
+    ("service.properties", "DEV_GROUP")
+]
+
 
 def main():
     """主函数"""
@@ -72,31 +141,20 @@ def service_registration():
     
     # 多服务注册示例
     print("\n  多服务注册:")
-    services = [
-        {
-            "name": "user-service",
-            "port": 8081,
-            "metadata": {"module": "user", "version": "1.0.0"}
-        },
-        {
-            "name": "order-service", 
-            "port": 8082,
-            "metadata": {"module": "order", "version": "1.0.0"}
-        },
-        {
-            "name": "payment-service",
-            "port": 8083,
-            "metadata": {"module": "payment", "version": "1.0.0"}
+    # 各服务并发注册（基础服务注册时已初始化共享客户端），按完成顺序输出结果
+    with ThreadPoolExecutor(max_workers=min(8, len(SERVICES))) as executor:
+        futures = {
+            executor.submit(
+                registerNacos,
+                service_name=service["name"],
+                port=service["port"],
+                metadata=service["metadata"]
+            ): service
+            for service in SERVICES
         }
-    ]
-    
-    for service in services:
-        success = registerNacos(
-            service_name=service["name"],
-            port=service["port"],
-            metadata=service["metadata"]
-        )
-        
+        results = [(futures[future], future.result()) for future in as_completed(futures)]
+    
+    for service, success in results:
         if success:
             logger.info( "服务注册成功", extra={
                 "service_name": service["name"],
@@ -109,7 +167,43 @@ def service_registration():
             })
             print(f"  ✗ {service['name']} 注册失败")
     
-    time.sleep(2)  # 等待注册完成
+    # 等待注册生效：实例在 Nacos 中可见后立即继续，而不是固定等待 2 秒
+    service_names = ["example-service"] + [service["name"] for service in SERVICES]
+    if not wait_for_registration(service_names, timeout=2.0):
+        logger.warning( "等待服务注册生效超时")
+        print("  ⚠ 等待服务注册生效超时")
+
+
+def wait_for_registration(service_names, timeout=2.0):
+    """
+    轮询 Nacos 直到所有服务的本机实例都可见（指数退避：20ms 起，最长 160ms）
+    
+    Returns:
+        是否在超时前全部可见
+    """
+    client = get_nacos_client()
+    if client is None:
+        return False
+    
+    local_ip = get_local_ip()
+    pending = set(service_names)
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    
+    while True:
+        pending = {
+            name for name in pending
+            if not any(host.get("ip") == local_ip
+                       for host in client.get_service_instances(name, healthy_only=False))
+        }
+        if not pending:
+            return True
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.16)
 
 
 def configuration_management():
@@ -121,10 +215,10 @@ def configuration_management():
     
     # 获取应用配置
     print("\n  获取应用配置:")
-    app_config = get_config("app.json")
+    app_config = get_config("app.json", ttl=CONFIG_CACHE_TTL)
     if app_config:
         try:
-            config_data = json.loads(app_config)
+            config_data = _loads(app_config)
             logger.info( "应用配置获取成功", extra={
                 "config_keys": list(config_data.keys())
             })
@@ -136,23 +230,11 @@ def configuration_management():
         logger.warning( "应用配置不存在")
         print("  ⚠ 应用配置不存在，使用默认配置")
         # 使用默认配置
-        default_config = {
-            "database": {
-                "host": "localhost",
-                "port": 3306,
-                "name": "example_db"
-            },
-            "redis": {
-                "host": "localhost",
-                "port": 6379
-            },
-            "log_level": "INFO"
-        }
-        print(f"  ✓ 默认配置: {default_config}")
+        print(f"  ✓ 默认配置: {DEFAULT_APP_CONFIG}")
     
     # 获取数据库配置
     print("\n  获取数据库配置:")
-    db_config = get_config("database.yml")
+    db_config = get_config("database.yml", ttl=CONFIG_CACHE_TTL)
     if db_config:
         logger.info( "数据库配置获取成功")
         print(f"  ✓ 数据库配置: {db_config}")
@@ -164,8 +246,11 @@ def configuration_management():
     print("\n  获取不同分组配置:")
     groups = ["DEFAULT_GROUP", "DEV_GROUP", "PROD_GROUP"]
     
-    for group in groups:
-        config = get_config("service.properties", group)
+    # 各分组并发获取（map 保持结果顺序与 groups 一致）
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        results = list(executor.map(lambda group: (group, get_config("service.properties", group, ttl=CONFIG_CACHE_TTL)), groups))
+    
+    for group, config in results:
         if config:
             logger.info( "配置获取成功", extra={
                 "group": group,
@@ -190,15 +275,14 @@ def service_runtime_simulation():
         print("\n  接收到退出信号，正在注销服务...")
         
         # 注销所有服务
-        services = [
-            ("example-service", 8080),
-            ("user-service", 8081),
-            ("order-service", 8082),
-            ("payment-service", 8083)
-        ]
+        services = [("example-service", 8080)]
+        services.extend((service["name"], service["port"]) for service in SERVICES)
         
-        for service_name, port in services:
-            success = unregisterNacos(service_name, port)
+        # 各服务并发注销
+        with ThreadPoolExecutor(max_workers=min(8, len(services))) as executor:
+            results = list(executor.map(lambda service: unregisterNacos(*service), services))
+        
+        for (service_name, port), success in zip(services, results):
             if success:
                 logger.info( "服务注销成功", extra={
                     "service_name": service_name,
@@ -226,14 +310,20 @@ def service_runtime_simulation():
     print("\n  服务运行中...")
     print("  按 Ctrl+C 退出")
     
+    # 请求日志先缓存，每 LOG_FLUSH_SIZE 条批量记录一次
+    records = []
+    
     try:
         # 模拟业务处理
-        for i in range(10):
-            logger.info( "处理业务请求", extra={
-                "request_id": f"REQ-{i+1:03d}",
+        for i, request_id in enumerate(REQUEST_IDS):
+            records.append(("处理业务请求", {
+                "request_id": request_id,
                 "processing_time": 100 + i * 10
-            })
-            print(f"  处理请求 {i+1}/10")
+            }))
+            if len(records) >= LOG_FLUSH_SIZE:
+                logger.log_bulk(logging.INFO, records, context=ctx)
+                records.clear()
+            print(PROGRESS_LINES[i])
             time.sleep(1)
         
         print("\n  模拟运行完成")
@@ -241,17 +331,25 @@ def service_runtime_simulation():
     except KeyboardInterrupt:
         # 手动触发信号处理器
         signal_handler(signal.SIGINT, None)
+    finally:
+        if records:
+            logger.log_bulk(logging.INFO, records, context=ctx)
 
 
 class ConfigWatcher:
-    """配置监听器"""
+    """配置监听器（基于 Nacos 长轮询，配置变化时推送回调）"""
     
     def __init__(self):
         self.logger = get_logger("config-watcher")
-        self.ctx = create_context()
+        self._ctx = None
         self.running = False
-        self.thread = None
-        self.last_config_hash = {}
+    
+    @property
+    def ctx(self):
+        """监听器的上下文：首次使用时创建，优先沿用当前请求的上下文（TraceID）"""
+        if self._ctx is None:
+            self._ctx = get_current_context() or create_context()
+        return self._ctx
     
     def start(self):
         """启动配置监听"""
@@ -259,10 +357,10 @@ class ConfigWatcher:
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._watch_config, daemon=True)
-        self.thread.start()
+        for data_id, group in CONFIGS_TO_WATCH:
+            add_config_watcher(data_id, group, self._on_config_changed)
         
-        self.logger.info(self.ctx, "配置监听器启动")
+        self.logger.info("配置监听器启动", context=self.ctx)
         print("  ✓ 配置监听器启动")
     
     def stop(self):
@@ -271,72 +369,44 @@ class ConfigWatcher:
             return
         
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1)
+        for data_id, group in CONFIGS_TO_WATCH:
+            remove_config_watcher(data_id, group, self._on_config_changed)
         
-        self.logger.info(self.ctx, "配置监听器停止")
+        self.logger.info("配置监听器停止", context=self.ctx)
         print("  ✓ 配置监听器停止")
     
-    def _watch_config(self):
-        """监听配置变化"""
-        configs_to_watch = [
-            ("app.json", "DEFAULT_GROUP"),
-            ("database.yml", "DEFAULT_GROUP"),
-            ("service.properties", "DEV_GROUP")
-        ]
-        
-        while self.running:
-            try:
-                for data_id, group in configs_to_watch:
-                    config = get_config(data_id, group)
-                    if config:
-                        config_hash = hash(config)
-                        key = f"{data_id}#{group}"
-                        
-                        if key in self.last_config_hash:
-                            if self.last_config_hash[key] != config_hash:
-                                self.logger.info(self.ctx, "配置发生变化", extra={
-                                    "data_id": data_id,
-                                    "group": group,
-                                    "config_length": len(config)
-                                })
-                                print(f"  📝 配置变化: {data_id} ({group})")
-                                self._on_config_changed(data_id, group, config)
-                        
-                        self.last_config_hash[key] = config_hash
-                
-                time.sleep(5)  # 每5秒检查一次
-                
-            except Exception as e:
-                self.logger.error(self.ctx, "配置监听异常", extra={
-                    "error": str(e)
-                })
-                time.sleep(10)  # 异常时等待更长时间
-    
     def _on_config_changed(self, data_id, group, config):
         """配置变化处理"""
+        print(f"  📝 配置变化: {data_id} ({group})")
+        if config is None:
+            self.logger.warning("配置已被删除", extra={
+                "data_id": data_id,
+                "group": group
+            }, context=self.ctx)
+            return
+        
         try:
             if data_id == "app.json":
                 # 处理应用配置变化
-                config_data = json.loads(config)
-                self.logger.info(self.ctx, "应用配置已更新", extra={
+                config_data = _loads(config)
+                self.logger.info("应用配置已更新", extra={
                     "config_keys": list(config_data.keys())
-                })
+                }, context=self.ctx)
                 
             elif data_id == "database.yml":
                 # 处理数据库配置变化
-                self.logger.info(self.ctx, "数据库配置已更新")
+                self.logger.info("数据库配置已更新", context=self.ctx)
                 
             elif data_id == "service.properties":
                 # 处理服务配置变化
-                self.logger.info(self.ctx, "服务配置已更新")
+                self.logger.info("服务配置已更新", context=self.ctx)
                 
         except Exception as e:
-            self.logger.error(self.ctx, "配置处理失败", extra={
+            self.logger.error("配置处理失败", extra={
                 "data_id": data_id,
                 "group": group,
                 "error": str(e)
-            })
+            }, context=self.ctx)
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ from .code import (
 # 导入 HTTP 客户端
 from .client import HttpClient
 from .middleware import (
+    ASGIMiddleware,
     create_fastapi_middleware,
     create_flask_middleware,
     create_django_middleware
@@ -57,6 +58,7 @@ __all__ = [
     'HttpClient',
     
     # 中间件
+    'ASGIMiddleware',
     'create_fastapi_middleware',
     'create_flask_middleware', 
     'create_django_middleware'
@@ -15,7 +15,7 @@ from requests.adapters import HTTPAdapter
 import py_sdk
 from ..context.manager import get_current_context
 from .response import APIResponse
-from .code import INTERNAL_SERVER_ERROR
+from .code import OK, INTERNAL_SERVER_ERROR
 from ..nacos_sdk.api import get_config
 
 # 安全导入 urllib3
@@ -168,8 +168,6 @@ class HttpClient:
     
     def _parse_response(self, response: requests.Response) -> APIResponse:
         """解析响应"""
-        from .code import OK
-        
         try:
             # 尝试解析 JSON
             if response.headers.get("content-type", "").startswith("application/json"):
@@ -23,6 +23,9 @@ from typing import Optional
 class BusinessCode:
     """业务状态码类"""
     
+    # 状态码通常作为模块级常量长期存在，使用 __slots__ 避免每个实例携带 __dict__
+    __slots__ = ('code', 'message', 'i18n')
+    
     def __init__(self, code: int, message: str, i18n: str = ""):
         """
         初始化业务状态码
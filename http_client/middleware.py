@@ -6,10 +6,31 @@ HTTP 中间件
 """
 
 import logging
-from typing import Callable, Any
-from ..context.manager import create_context_from_request, set_context, get_current_context
+from typing import Awaitable, Callable, Any, Dict, Optional
+from ..context.manager import (
+    create_context_from_request, set_context, reset_context, get_current_context, _new_context
+)
 from ..logger import logger
 
+# ASGI 接口类型
+_Scope = Dict[str, Any]
+_Message = Dict[str, Any]
+_Receive = Callable[[], Awaitable[_Message]]
+_Send = Callable[[_Message], Awaitable[None]]
+_ASGIApp = Callable[[_Scope, _Receive, _Send], Awaitable[None]]
+
+
+def _trace_id_from_scope(scope: _Scope) -> Optional[str]:
+    """
+    从 ASGI scope 的原始请求头（小写的 bytes 键值对）中查找 TraceID
+    
+    只比较 bytes 键，找到即停止，不会解码其他请求头
+    """
+    for key, value in scope.get("headers", ()):
+        if key == b"x-trace-id":
+            return value.decode("latin-1")
+    return None
+
 
 def create_fastapi_middleware():
     """
@@ -28,8 +49,8 @@ def create_fastapi_middleware():
     
     async def middleware(request, call_next):
         """FastAPI 中间件实现"""
-        # 从请求创建上下文
-        ctx = create_context_from_request(request)
+        # 从原始请求头创建上下文（不构建 Starlette 的 Headers 对象）
+        ctx = _new_context(_trace_id_from_scope(request.scope))
         set_context(ctx)
         
         # 记录请求开始日志
@@ -264,4 +285,62 @@ class WSGIMiddleware:
         except Exception as e:
             # 记录异常日志
             logger.exception(ctx, f"请求处理异常: {request.method} {request.url}")
-            raise 
\ No newline at end of file
+            raise
+
+
+class ASGIMiddleware:
+    """
+    ASGI 中间件（FastAPI/Starlette 推荐使用）
+    
+    直接实现 ASGI 接口，不经过 BaseHTTPMiddleware，
+    每个请求不会额外创建任务和内存流，只在响应开始时注入 TraceID 响应头。
+    
+    Example:
+        >>> from fastapi import FastAPI
+        >>> from http_client import ASGIMiddleware
+        >>> 
+        >>> app = FastAPI()
+        >>> app.add_middleware(ASGIMiddleware)
+    """
+    
+    def __init__(self, app: _ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: _Scope, receive: _Receive, send: _Send) -> None:
+        """ASGI 调用"""
+        # 只处理 HTTP 请求，websocket/lifespan 直接透传
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # 创建上下文并设置为当前上下文，请求结束后通过令牌恢复
+        ctx = _new_context(_trace_id_from_scope(scope))
+        token = set_context(ctx)
+        method = scope.get("method", "GET")
+        path = scope.get("path", "/")
+        
+        # 记录请求开始日志
+        logger.info("收到请求: %s %s", method, path)
+        
+        trace_header = (b"x-trace-id", ctx.trace_id.encode("latin-1"))
+        status_code = 500
+        
+        async def send_wrapper(message: _Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                # 添加 TraceID 到响应头
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), trace_header]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # 记录异常日志
+            logger.exception("请求处理异常: %s %s", method, path, context=ctx)
+            raise
+        else:
+            # 记录请求完成日志
+            logger.info("请求完成: %s %s - %s", method, path, status_code)
+        finally:
+            reset_context(token)
@@ -11,6 +11,34 @@ from typing import Any, Dict, Optional, Union
 from ..context.manager import get_current_context, Context
 from .code import BusinessCode, OK
 
+# 可选依赖：orjson（C 实现，序列化速度远高于标准库 json）
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    _ORJSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """序列化为 JSON 字符串，优先使用 orjson，不支持的类型回退到标准库"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """序列化为紧凑的 UTF-8 JSON 字节串（无缩进），可直接作为 HTTP 响应体"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_COMPACT_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class APIResponse:
     """标准 API 响应类"""
@@ -65,7 +93,11 @@ class APIResponse:
     
     def to_json(self) -> str:
         """转换为 JSON 字符串"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return _dumps(self.to_dict())
+    
+    def to_json_bytes(self) -> bytes:
+        """转换为紧凑的 JSON 字节串（UTF-8，无缩进），适合直接写入 HTTP 响应体"""
+        return _dumps_bytes(self.to_dict())
     
     def is_success(self) -> bool:
         """判断是否成功响应"""
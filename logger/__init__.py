@@ -22,7 +22,7 @@ from .manager import (
 logger = get_logger()
 
 # 便捷的初始化函数
-def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None, service_name=None, high_performance=True, logger_name=None):
+def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None, service_name=None, high_performance=True, logger_name=None, async_sink=False):
     """
     便捷的日志初始化函数
     
@@ -33,7 +33,9 @@ def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None,
         tls: TLS输出配置 (None 或 True 或 配置字典)
         topic_id: 火山引擎 TLS TopicID
         service_name: 服务名称
-        high_performance: 是否启用高性能模式 (默认True，使用异步处理)
+        high_performance: 是否启用高性能模式 (默认True，使用异步处理，队列满时丢弃日志；
+            传 "reliable" 时同样异步处理，但队列满时阻塞业务线程等待，避免日志丢失)
+        async_sink: 是否启用异步输出 (True 或 配置字典)，业务线程只入队，由后台线程格式化和输出
     
     Examples:
         # 最简单的初始化（只输出到控制台）
@@ -48,6 +50,9 @@ def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None,
         # 启用TLS输出（高性能模式）
         init_logger(tls=True, topic_id="your-topic-id")
         
+        # 启用TLS输出（可靠模式：队列满时阻塞等待而不是丢弃）
+        init_logger(tls=True, topic_id="your-topic-id", high_performance="reliable")
+        
         # 启用TLS输出（同步模式，兼容旧版本）
         init_logger(tls=True, topic_id="your-topic-id", high_performance=False)
         
@@ -56,9 +61,9 @@ def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None,
             level="INFO",
             console=True,
             tls={
-                "batch_size": 200,      # 批量大小
-                "batch_timeout": 3.0,   # 批量超时
+                "batch_size": 200,      # 单次发送的最大条数
                 "queue_size": 20000,    # 队列大小
+                "overflow_policy": "block",  # 队列满时阻塞等待 ("drop" 为丢弃)
                 "worker_threads": 4,    # 工作线程数
                 "retry_times": 5        # 重试次数
             },
@@ -100,10 +105,19 @@ def init_logger(level="INFO", console=True, file=None, tls=None, topic_id=None,
         # 设置性能模式
         if not high_performance:
             config["handlers"]["tls"]["sync_mode"] = True
+        elif high_performance == "reliable":
+            config["handlers"]["tls"]["overflow_policy"] = "block"
         
         if isinstance(tls, dict):
             config["handlers"]["tls"].update(tls)
     
+    # 配置异步输出
+    if async_sink:
+        config["async_sink"] = {"enabled": True}
+        
+        if isinstance(async_sink, dict):
+            config["async_sink"].update(async_sink)
+    
     init_logger_manager(config, topic_id=topic_id, service_name=service_name, logger_name=logger_name)
 
 __all__ = [
@@ -0,0 +1,138 @@
+"""
+异步日志输出
+
+基于 logging.handlers.QueueHandler + QueueListener：业务线程只负责把日志记录放入队列，
+格式化以及控制台/文件/TLS 等实际输出全部在后台监听线程中完成。
+
+特性：
+- 业务线程不再执行格式化和 I/O
+- 有界队列，队列满时默认丢弃（drop_on_full），突发流量不会阻塞业务线程
+- TraceID 在入队时从当前上下文捕获，后台线程格式化时保持正确
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import List
+
+from ..context.manager import _get_context
+
+# 队列满丢弃日志时，每丢弃这么多条由后台线程输出一次警告
+_DROP_REPORT_INTERVAL = 1000
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """入队日志处理器：入队前捕获 TraceID，队列满时可选择丢弃（丢弃数量记录在 dropped_count）"""
+
+    def __init__(self, log_queue: queue.Queue, drop_on_full: bool = True):
+        super().__init__(log_queue)
+        self.drop_on_full = drop_on_full
+        self.dropped_count = 0
+
+    def prepare(self, record):
+        # 只捕获依赖当前上下文的 TraceID，格式化留给后台线程
+        if not hasattr(record, 'trace_id'):
+            record.trace_id = _get_context().trace_id
+        return record
+
+    def enqueue(self, record):
+        if not self.drop_on_full:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # emit 在处理器锁内调用，计数无需额外加锁
+            self.dropped_count += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """
+    后台监听线程
+
+    停止时阻塞写入结束标记，避免队列满时 put_nowait 抛出 queue.Full；
+    入队处理器丢弃了日志时，由后台线程通过实际的输出处理器发出 py_sdk.logger 警告
+    （不经过已满的队列，也不会在业务线程中递归记录日志）。
+    """
+
+    def __init__(self, log_queue: queue.Queue, queue_handler: DroppingQueueHandler,
+                 *handlers: logging.Handler, respect_handler_level: bool = False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.queue_handler = queue_handler
+        self.reported_dropped = 0
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def handle(self, record):
+        super().handle(record)
+        self.report_dropped()
+
+    def report_dropped(self, force: bool = False):
+        """丢弃数量首次出现、每增加 _DROP_REPORT_INTERVAL 条或 force 时输出一次警告"""
+        dropped = self.queue_handler.dropped_count
+        reported = self.reported_dropped
+        if dropped == reported:
+            return
+        if not force and reported and dropped // _DROP_REPORT_INTERVAL == reported // _DROP_REPORT_INTERVAL:
+            return
+        self.reported_dropped = dropped
+        warning = logging.LogRecord(
+            "py_sdk.logger", logging.WARNING, __file__, 0,
+            "异步日志队列已满，已丢弃 %d 条日志", (dropped,), None
+        )
+        super().handle(warning)
+
+
+class AsyncLogSink:
+    """异步日志输出：接管根日志记录器上的处理器，由后台线程执行输出"""
+
+    def __init__(self, handlers: List[logging.Handler], queue_size: int = 8192,
+                 drop_on_full: bool = True):
+        """
+        初始化异步日志输出
+
+        Args:
+            handlers: 实际执行输出的处理器（控制台、文件、TLS 等）
+            queue_size: 队列大小
+            drop_on_full: 队列满时是否丢弃日志（False 时阻塞等待）
+        """
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.handler = DroppingQueueHandler(self.queue, drop_on_full=drop_on_full)
+        self.listener = _QueueListener(
+            self.queue, self.handler, *handlers, respect_handler_level=True
+        )
+        self._started = False
+
+    @property
+    def handlers(self):
+        """后台线程持有的实际输出处理器"""
+        return self.listener.handlers
+
+    @property
+    def dropped_count(self) -> int:
+        """队列满时丢弃的日志数量"""
+        return self.handler.dropped_count
+
+    def remove_handler(self, handler: logging.Handler):
+        """不再由后台线程向该处理器输出（重新配置时替换处理器用）"""
+        self.listener.handlers = tuple(h for h in self.listener.handlers if h is not handler)
+
+    def start(self):
+        """启动后台监听线程，并把入队处理器挂到根日志记录器上"""
+        if self._started:
+            return
+        self.listener.start()
+        self._started = True
+        logging.getLogger().addHandler(self.handler)
+
+    def stop(self):
+        """从根日志记录器摘下入队处理器，停止后台线程，并输出队列中剩余的日志"""
+        if not self._started:
+            return
+        self._started = False
+        # 先摘下入队处理器，之后的日志不再进入即将停止消费的队列
+        logging.getLogger().removeHandler(self.handler)
+        self.listener.stop()
+        self.listener.report_dropped(force=True)
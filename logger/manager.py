@@ -11,16 +11,49 @@
 - 失败重试机制
 """
 
+import atexit
+import collections
+import functools
+import itertools
 import logging
 import logging.handlers
+# 数值级别常量直接绑定到模块全局，SDKLogger 各级别方法中省去 logging.X 的属性查找
+from logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
 import sys
 import threading
-import queue
 import time
+import weakref
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Deque, Dict, Any, Iterable, List, Tuple
 from concurrent.futures import ThreadPoolExecutor
-from ..context.manager import get_current_context, Context
+from ..context.manager import Context, _get_context
+from .async_sink import AsyncLogSink
+
+# 可选依赖：orjson（C 实现的 JSON 解析/序列化，未安装时使用标准库）
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+def _to_log_value(value: Any) -> str:
+    """把 extra 中的字段值转换为 TLS 日志内容要求的字符串：非字符串值序列化为紧凑 JSON"""
+    if isinstance(value, str):
+        return value
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _update_log_content(log_content: Dict[str, str], extra: Dict[str, Any]):
+    """把 extra 合并进 TLS 日志内容"""
+    for key, value in extra.items():
+        log_content[key] = _to_log_value(value)
 
 # 默认配置
 DEFAULT_CONFIG = {
@@ -46,26 +79,248 @@ DEFAULT_CONFIG = {
             "access_key_id": "",
             "access_key_secret": ""
         }
+    },
+    # 异步输出：业务线程只入队，格式化和输出由后台线程完成
+    "async_sink": {
+        "enabled": False,
+        "queue_size": 8192,
+        "drop_on_full": True
     }
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_tls_client(endpoint: str, access_key_id: str, access_key_secret: str,
+                    region: str, token: str = ""):
+    """
+    获取 TLS 客户端（按连接参数缓存）
+    
+    重新配置或重建 TLS 处理器时复用已初始化的客户端，避免重复创建。
+    未安装火山引擎 SDK 时抛出 ImportError。
+    """
+    from volcengine.tls.TLSService import TLSService
+    
+    client = TLSService(
+        endpoint=endpoint,
+        access_key_id=access_key_id,
+        access_key_secret=access_key_secret,
+        region=region
+    )
+    
+    if token:
+        client.set_session_token(token)
+    
+    return client
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tls_request_classes():
+    """
+    获取 TLS 请求类 (PutLogsV2Request, PutLogsV2Logs)
+    
+    只在首次发送时导入一次，之后每批/每条日志直接复用。
+    未安装火山引擎 SDK 时抛出 ImportError。
+    """
+    from volcengine.tls.tls_requests import PutLogsV2Request, PutLogsV2Logs
+    return PutLogsV2Request, PutLogsV2Logs
+
+
+class _RecordQueue:
+    """
+    有界日志队列（deque + Condition）
+    
+    与 queue.Queue 不同，支持在一次加锁内放入或取出多条日志；
+    关闭后不再接收新日志，工作线程取完剩余日志后退出，无需在队列中放入结束标记。
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.closed = False
+        self._items: Deque[logging.LogRecord] = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def put(self, record: logging.LogRecord, block: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        放入一条日志
+        
+        Args:
+            block: 队列满时是否等待
+            timeout: 最长等待秒数，None 表示一直等待
+        
+        Returns:
+            是否放入成功（队列已满或已关闭时为 False）
+        """
+        with self._lock:
+            if len(self._items) >= self.maxsize and not self.closed:
+                if not block or not self._not_full.wait_for(
+                    lambda: len(self._items) < self.maxsize or self.closed, timeout
+                ):
+                    return False
+            if self.closed:
+                return False
+            self._items.append(record)
+            self._not_empty.notify()
+            return True
+    
+    def put_many(self, records: List[logging.LogRecord]) -> int:
+        """
+        在一次加锁内放入多条日志（不等待）
+        
+        Returns:
+            实际放入的数量，队列剩余空间不足时只放入前面的部分
+        """
+        with self._lock:
+            if self.closed:
+                return 0
+            space = self.maxsize - len(self._items)
+            if space <= 0:
+                return 0
+            if len(records) > space:
+                records = records[:space]
+            self._items.extend(records)
+            self._not_empty.notify()
+            return len(records)
+    
+    def get_batch(self, batch: List[logging.LogRecord], max_items: int, timeout: float = 0) -> int:
+        """
+        在一次加锁内取出最多 max_items 条日志追加到 batch
+        
+        Args:
+            timeout: 队列为空时最长等待秒数，0 表示不等待
+        
+        Returns:
+            取出的数量
+        """
+        with self._lock:
+            items = self._items
+            if not items and timeout and not self.closed:
+                self._not_empty.wait(timeout)
+            count = min(len(items), max_items)
+            if count:
+                popleft = items.popleft
+                batch.extend([popleft() for _ in range(count)])
+                self._not_full.notify(count)
+            return count
+    
+    def close(self):
+        """关闭队列并唤醒所有等待的线程"""
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+
+# TLS 工作线程在自己的分片和其他分片都没有日志时的最长等待时间（秒）：
+# 自己的分片有新日志时立即唤醒，超时后重新检查其他分片是否有可窃取的积压
+_WORKER_IDLE_WAIT = 0.1
+
+
 class TraceIDFormatter(logging.Formatter):
     """支持 TraceID 的日志格式化器"""
     
     def format(self, record):
-        # 获取当前上下文中的 TraceID
-        context = get_current_context()
-        trace_id = context.trace_id if context else "unknown"
-        
-        # 添加 trace_id 到日志记录
-        record.trace_id = trace_id
+        # 优先使用记录上已携带的 TraceID（显式传入的上下文或异步输出入队时捕获的），
+        # 否则取当前上下文中的 TraceID（未设置上下文时为哨兵 NULL_TRACE_ID）
+        if not hasattr(record, 'trace_id'):
+            record.trace_id = _get_context().trace_id
         
 
         
         return super().format(record)
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """带写缓冲的滚动文件处理器
+    
+    RotatingFileHandler 每条日志都会 flush 一次（并在检查滚动时 seek/tell 触发 flush）。
+    本处理器把日志写入较大的文件缓冲区，由后台线程每 flush_interval 秒统一刷盘；
+    flush_level 及以上级别（默认 ERROR）的日志立即刷盘，避免进程崩溃时丢失关键日志。
+    文件大小由处理器按编码后的字节数自行累计，检查滚动时不再访问文件。
+    """
+    
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, encoding: str = None,
+                 flush_interval: float = 0.05, buffer_size: int = 64 * 1024,
+                 flush_level: int = ERROR):
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._size = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        
+        self._stop_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="log-file-flusher", daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=getattr(self, 'errors', None))
+        # 追加模式下打开后的位置即为当前文件大小
+        self._size = stream.tell()
+        return stream
+    
+    def _encoded_size(self, msg: str) -> int:
+        """消息写入文件后占用的字节数（按文件编码计算，非 ASCII 字符会占多个字节）"""
+        stream = self.stream
+        return len(msg.encode(stream.encoding or 'utf-8', stream.errors or 'strict'))
+    
+    def _should_rollover(self, size: int) -> bool:
+        return self.maxBytes > 0 and self._size > 0 and self._size + size >= self.maxBytes
+    
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._should_rollover(self._encoded_size(self.format(record) + self.terminator))
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            
+            # 每条日志只格式化一次，同一份结果用于滚动判断和写入
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self._should_rollover(size):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += size
+            
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self):
+        """后台定时刷盘"""
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._stop_event.set()
+        super().close()
+
+
+# 尚未关闭的 AsyncTLSHandler，进程退出时统一关闭
+_live_tls_handlers: "weakref.WeakSet[AsyncTLSHandler]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_tls_handlers():
+    for handler in list(_live_tls_handlers):
+        handler.close()
+
+
 class AsyncTLSHandler(logging.Handler):
     """高性能异步火山引擎 TLS 日志处理器
     
@@ -87,23 +342,37 @@ class AsyncTLSHandler(logging.Handler):
         self._is_closing = False  # 防止重复关闭
         
         # 性能配置
-        self.batch_size = config.get("batch_size", 100)  # 批量发送大小
-        self.batch_timeout = config.get("batch_timeout", 5.0)  # 批量超时时间(秒)
+        self.batch_size = config.get("batch_size", 100)  # 单次发送的最大条数（自适应批量的上限）
+        self.batch_timeout = config.get("batch_timeout", 5.0)  # 已不再使用：日志不再等待攒批，保留以兼容旧配置
         self.queue_size = config.get("queue_size", 10000)  # 队列大小
         self.worker_threads = config.get("worker_threads", 2)  # 工作线程数
         self.retry_times = config.get("retry_times", 3)  # 重试次数
         self.retry_delay = config.get("retry_delay", 1.0)  # 重试延迟(秒)
+        # 队列满时的处理策略："drop" 丢弃日志（默认，不阻塞业务线程）；
+        # "block" 阻塞业务线程等待队列空出（最多 block_timeout 秒，None 表示一直等待），超时仍满才丢弃
+        self.overflow_policy = config.get("overflow_policy", "drop")
+        if self.overflow_policy not in ("drop", "block"):
+            raise ValueError(f"overflow_policy 只能是 'drop' 或 'block'，当前为 {self.overflow_policy!r}")
+        self.block_timeout = config.get("block_timeout", 1.0)
+        self.dropped_count = 0
+        self._dropped_lock = threading.Lock()
         
         # 内部状态
-        self.log_queue = queue.Queue(maxsize=self.queue_size)
+        # 按工作线程分片的队列：每个生产线程优先写入固定的一个分片（已满时写入其他分片），
+        # 每个工作线程优先消费自己的分片、空闲时窃取其他分片的积压，避免所有线程争用同一把队列锁；
+        # 分片总容量仍为 queue_size
+        shards = max(self.worker_threads, 1)
+        self.log_queues = [_RecordQueue(max(self.queue_size // shards, 1)) for _ in range(shards)]
+        self._shard_counter = itertools.count()
+        self._producer_shard = threading.local()
         self.executor = ThreadPoolExecutor(max_workers=self.worker_threads, thread_name_prefix="tls-logger")
-        self.shutdown_event = threading.Event()
-        self.batch_buffer = []
-        self.last_batch_time = time.time()
         
         # 初始化客户端和启动工作线程
         self._init_client()
         self._start_workers()
+        
+        # 进程退出时发送队列中剩余的日志（弱引用登记，已替换并关闭的处理器可以被回收）
+        _live_tls_handlers.add(self)
     
     def _init_client(self):
         """初始化 TLS 客户端"""
@@ -114,8 +383,19 @@ class AsyncTLSHandler(logging.Handler):
                 logging.getLogger("py_sdk.logger").info("TLS 配置为空或无效，跳过初始化")
                 return
             
+            region = tls_config.get("region", "cn-beijing")
+            endpoint = tls_config.get("endpoint", "")
+            if not endpoint:
+                endpoint = f"https://tls-{region}.volces.com"
+            
             try:
-                from volcengine.tls.TLSService import TLSService
+                self.client = _get_tls_client(
+                    endpoint,
+                    tls_config.get("access_key_id", ""),
+                    tls_config.get("access_key_secret", ""),
+                    region,
+                    tls_config.get("token", "")
+                )
             except ImportError as e:
                 logging.getLogger("py_sdk.logger").warning(
                     f"火山引擎 TLS SDK 未安装，TLS 日志功能不可用: {str(e)}. "
@@ -123,22 +403,6 @@ class AsyncTLSHandler(logging.Handler):
                 )
                 return
             
-            region = tls_config.get("region", "cn-beijing")
-            endpoint = tls_config.get("endpoint", "")
-            if not endpoint:
-                endpoint = f"https://tls-{region}.volces.com"
-            
-            self.client = TLSService(
-                endpoint=endpoint,
-                access_key_id=tls_config.get("access_key_id", ""),
-                access_key_secret=tls_config.get("access_key_secret", ""),
-                region=region
-            )
-            
-            token = tls_config.get("token", "")
-            if token:
-                self.client.set_session_token(token)
-            
             logging.getLogger("py_sdk.logger").info("异步TLS客户端初始化成功")
             
         except Exception as e:
@@ -164,102 +428,116 @@ class AsyncTLSHandler(logging.Handler):
     def _start_workers(self):
         """启动工作线程"""
         for i in range(self.worker_threads):
-            self.executor.submit(self._worker_loop, f"worker-{i}")
+            self.executor.submit(self._worker_loop, f"worker-{i}", i)
+    
+    def _get_shard(self) -> _RecordQueue:
+        """当前生产线程对应的队列分片（线程首次写入时轮询分配，之后固定）"""
+        shard = getattr(self._producer_shard, 'queue', None)
+        if shard is None:
+            shard = self._producer_shard.queue = self.log_queues[next(self._shard_counter) % len(self.log_queues)]
+        return shard
+    
+    def _put(self, record: logging.LogRecord) -> bool:
+        """
+        放入一条日志：优先当前线程的分片，已满时放入其他分片，
+        单个生产线程（如 asyncio 服务）也能用满全部 queue_size 容量；所有分片都满时按 overflow_policy 处理
+        """
+        shard = self._get_shard()
+        if shard.put(record):
+            return True
+        for other in self.log_queues:
+            if other is not shard and other.put(record):
+                return True
+        return self.overflow_policy == "block" and shard.put(record, block=True, timeout=self.block_timeout)
     
-    def _worker_loop(self, worker_name: str):
-        """工作线程循环"""
+    def _steal(self, own_index: int, batch: List[logging.LogRecord]):
+        """自己的分片为空时，从其他分片取出一整批日志（最多 batch_size 条），与分片所有者并行发送"""
+        shards = len(self.log_queues)
+        for offset in range(1, shards):
+            if self.log_queues[(own_index + offset) % shards].get_batch(batch, self.batch_size):
+                return
+    
+    def _worker_loop(self, worker_name: str, shard_index: int = 0):
+        """
+        工作线程循环
+        
+        自适应批量（One-or-all）：每次把队列中已积压的日志一并取出（最多 batch_size 条）立即发送。
+        低流量时单条日志无需等待攒批，高流量时积压越多批量越大，无需按流量调优 batch_timeout。
+        队列关闭后发送完剩余的日志再退出。
+        """
         logging.getLogger("py_sdk.logger").debug(f"TLS日志工作线程 {worker_name} 启动")
         
-        while not self.shutdown_event.is_set():
+        own_queue = self.log_queues[shard_index]
+        
+        while True:
             try:
-                # 尝试获取日志记录
-                try:
-                    record = self.log_queue.get(timeout=1.0)
-                    if record is None:  # 关闭信号
+                # 优先自己的分片，为空时先从其他分片窃取，都没有日志时才等待
+                batch: List[logging.LogRecord] = []
+                own_queue.get_batch(batch, self.batch_size)
+                if not batch:
+                    self._steal(shard_index, batch)
+                if not batch:
+                    if own_queue.closed:
                         break
-                    
-                    self.batch_buffer.append(record)
-                    
-                    # 检查是否需要发送批量
-                    current_time = time.time()
-                    should_send = (
-                        len(self.batch_buffer) >= self.batch_size or
-                        (self.batch_buffer and current_time - self.last_batch_time >= self.batch_timeout)
-                    )
-                    
-                    if should_send:
-                        self._send_batch()
-                        self.last_batch_time = current_time
-                    
-                except queue.Empty:
-                    # 超时检查是否需要发送剩余日志
-                    current_time = time.time()
-                    if self.batch_buffer and current_time - self.last_batch_time >= self.batch_timeout:
-                        self._send_batch()
-                        self.last_batch_time = current_time
-                    continue
+                    if not own_queue.get_batch(batch, self.batch_size, timeout=_WORKER_IDLE_WAIT):
+                        continue
+                
+                self._send_batch(batch)
                 
             except Exception as e:
                 logging.getLogger("py_sdk.logger").error(f"TLS工作线程 {worker_name} 异常: {str(e)}")
                 time.sleep(1.0)
         
-        # 发送剩余的日志
-        if self.batch_buffer:
-            self._send_batch()
-        
         logging.getLogger("py_sdk.logger").debug(f"TLS日志工作线程 {worker_name} 停止")
     
-    def _send_batch(self):
+    def _send_batch(self, batch_to_send: List[logging.LogRecord]):
         """批量发送日志"""
-        if not self.client or not self.topic_id or not self.batch_buffer:
-            self.batch_buffer.clear()
+        if not self.client or not self.topic_id or not batch_to_send:
             return
         
-        batch_to_send = self.batch_buffer.copy()
-        self.batch_buffer.clear()
+        try:
+            PutLogsV2Request, PutLogsV2Logs = _get_tls_request_classes()
+        except ImportError:
+            logging.getLogger("py_sdk.logger").error("无法导入 TLS 请求类")
+            return
         
-        for attempt in range(self.retry_times):
-            try:
-                # 构建批量日志
-                log_contents = []
-                for record in batch_to_send:
-                    log_content = {
-                        "level": record.levelname,
-                        "logger": record.name,
-                        "message": record.getMessage(),
-                        "trace_id": getattr(record, 'trace_id', 'unknown'),
-                        "service_name": self.service_name or "unknown",
-                        "module": record.module,
-                        "function": record.funcName,
-                        "line": str(record.lineno),
-                        "thread": str(record.thread),
-                        "process": str(record.process),
-                        "timestamp": int(record.created)
-                    }
-                    
-                    if record.exc_info:
-                        log_content["exception"] = self.format(record)
-                    
-                    if hasattr(record, 'extra') and record.extra:
-                        log_content.update(record.extra)
-                    
-                    log_contents.append(log_content)
-                
-                # 发送到TLS
-                try:
-                    from volcengine.tls.tls_requests import PutLogsV2Request, PutLogsV2Logs
-                except ImportError:
-                    logging.getLogger("py_sdk.logger").error("无法导入 TLS 请求类")
-                    return
+        # 请求体只构建一次，重试时直接复用；每条日志的内容直接写入请求，不再经过中间列表
+        try:
+            service_name = self.service_name or "unknown"
+            logs = PutLogsV2Logs(source=self.service_name or "python-sdk", filename="application.log")
+            for record in batch_to_send:
+                log_content = {
+                    "level": record.levelname,
+                    "logger": record.name,
+                    "message": record.getMessage(),
+                    "trace_id": getattr(record, 'trace_id', 'unknown'),
+                    "service_name": service_name,
+                    "module": record.module,
+                    "function": record.funcName,
+                    "line": str(record.lineno),
+                    "thread": str(record.thread),
+                    "process": str(record.process)
+                }
                 
-                logs = PutLogsV2Logs(source=self.service_name or "python-sdk", filename="application.log")
+                if record.exc_info:
+                    log_content["exception"] = self.format(record)
                 
-                for log_content in log_contents:
-                    timestamp = log_content.pop("timestamp")
-                    logs.add_log(contents=log_content, log_time=timestamp)
+                extra = getattr(record, 'extra', None)
+                if extra:
+                    _update_log_content(log_content, extra)
                 
-                request = PutLogsV2Request(self.topic_id, logs)
-                response = self.client.put_logs_v2(request)
+                logs.add_log(contents=log_content, log_time=int(record.created))
+            
+            request = PutLogsV2Request(self.topic_id, logs)
+        except Exception as e:
+            logging.getLogger("py_sdk.logger").error(
+                f"TLS日志构建失败，丢弃 {len(batch_to_send)} 条日志: {str(e)}"
+            )
+            return
+        
+        for attempt in range(self.retry_times):
+            try:
+                self.client.put_logs_v2(request)
                 
                 # 成功发送
                 logging.getLogger("py_sdk.logger").debug(f"批量发送 {len(batch_to_send)} 条日志成功")
@@ -281,12 +559,47 @@ class AsyncTLSHandler(logging.Handler):
         if not self.client or not self.topic_id:
             return
         
-        try:
-            # 非阻塞方式添加到队列
-            self.log_queue.put_nowait(record)
-        except queue.Full:
-            # 队列满了，丢弃日志并记录警告
-            logging.getLogger("py_sdk.logger").warning("TLS日志队列已满，丢弃日志记录")
+        if not self._put(record):
+            self._on_dropped(1)
+    
+    def handle_many(self, records: List[logging.LogRecord]):
+        """批量放入发送队列：过滤后在一次加锁内放入当前线程的分片，而不是每条日志各获取一次队列锁"""
+        if not self.client or not self.topic_id:
+            return
+        
+        if self.filters:
+            records = [record for record in records if self.filter(record)]
+        
+        shard = self._get_shard()
+        accepted = shard.put_many(records)
+        if accepted == len(records):
+            return
+        
+        # 当前分片已满时放入其他分片
+        for other in self.log_queues:
+            if other is not shard:
+                accepted += other.put_many(records[accepted:])
+                if accepted == len(records):
+                    return
+        
+        if self.overflow_policy != "block":
+            self._on_dropped(len(records) - accepted)
+            return
+        
+        # 阻塞模式：放不下的部分逐条等待队列空出
+        for index, record in enumerate(records[accepted:]):
+            if not shard.put(record, block=True, timeout=self.block_timeout):
+                self._on_dropped(len(records) - accepted - index)
+                return
+    
+    def _on_dropped(self, count: int):
+        """记录丢弃的日志数量，每丢弃 1000 条提示一次，避免刷屏"""
+        # 多个生产线程可能同时丢弃日志，计数需要加锁
+        with self._dropped_lock:
+            before = self.dropped_count
+            self.dropped_count = dropped = before + count
+        if before // 1000 != dropped // 1000 or before == 0:
+            print(f"TLS日志队列已满，已丢弃 {dropped} 条日志", file=sys.stderr)
     
     def close(self):
         """关闭处理器"""
@@ -294,17 +607,12 @@ class AsyncTLSHandler(logging.Handler):
             return  # 防止重复关闭
         
         self._is_closing = True
+        _live_tls_handlers.discard(self)
         logging.getLogger("py_sdk.logger").info("正在关闭异步TLS日志处理器...")
         
-        # 发送关闭信号
-        self.shutdown_event.set()
-        
-        # 向队列发送关闭信号
-        for _ in range(self.worker_threads):
-            try:
-                self.log_queue.put_nowait(None)
-            except queue.Full:
-                pass
+        # 关闭队列：工作线程发送完剩余的日志后退出
+        for log_queue in self.log_queues:
+            log_queue.close()
         
         # 等待工作线程完成
         self.executor.shutdown(wait=True)
@@ -334,8 +642,19 @@ class SyncTLSHandler(logging.Handler):
                 logging.getLogger("py_sdk.logger").info("TLS 配置为空或无效，跳过初始化")
                 return
             
+            region = tls_config.get("region", "cn-beijing")
+            endpoint = tls_config.get("endpoint", "")
+            if not endpoint:
+                endpoint = f"https://tls-{region}.volces.com"
+            
             try:
-                from volcengine.tls.TLSService import TLSService
+                self.client = _get_tls_client(
+                    endpoint,
+                    tls_config.get("access_key_id", ""),
+                    tls_config.get("access_key_secret", ""),
+                    region,
+                    tls_config.get("token", "")
+                )
             except ImportError as e:
                 logging.getLogger("py_sdk.logger").warning(
                     f"火山引擎 TLS SDK 未安装，TLS 日志功能不可用: {str(e)}. "
@@ -343,22 +662,6 @@ class SyncTLSHandler(logging.Handler):
                 )
                 return
             
-            region = tls_config.get("region", "cn-beijing")
-            endpoint = tls_config.get("endpoint", "")
-            if not endpoint:
-                endpoint = f"https://tls-{region}.volces.com"
-            
-            self.client = TLSService(
-                endpoint=endpoint,
-                access_key_id=tls_config.get("access_key_id", ""),
-                access_key_secret=tls_config.get("access_key_secret", ""),
-                region=region
-            )
-            
-            token = tls_config.get("token", "")
-            if token:
-                self.client.set_session_token(token)
-            
             logging.getLogger("py_sdk.logger").info("同步TLS客户端初始化成功")
             
         except Exception as e:
@@ -405,13 +708,14 @@ class SyncTLSHandler(logging.Handler):
             if record.exc_info:
                 log_content["exception"] = self.format(record)
             
-            if hasattr(record, 'extra') and record.extra:
-                log_content.update(record.extra)
+            extra = getattr(record, 'extra', None)
+            if extra:
+                _update_log_content(log_content, extra)
             
             timestamp = int(record.created)
             
             try:
-                from volcengine.tls.tls_requests import PutLogsV2Request, PutLogsV2Logs
+                PutLogsV2Request, PutLogsV2Logs = _get_tls_request_classes()
             except ImportError:
                 print("无法导入 TLS 请求类，请确认 volcengine 包已正确安装", file=sys.stderr)
                 return
@@ -434,6 +738,10 @@ class SyncTLSHandler(logging.Handler):
 TLSHandler = AsyncTLSHandler
 
 
+# logging 保留的参数，其余关键字参数均作为 extra 信息
+_LOG_PARAMS = frozenset({'exc_info', 'stack_info', 'stacklevel'})
+
+
 class SDKLogger:
     """SDK 日志记录器"""
     
@@ -441,60 +749,152 @@ class SDKLogger:
         self.name = name
         self.logger = logger
     
-    def _log(self, level: int, context: Optional[Context], message: str, **kwargs):
+    def _log(self, level: int, context: Optional[Context], message: str, args: tuple = (), **kwargs):
         """内部日志记录方法"""
+        # 级别未启用时直接返回，不再获取上下文、构建 extra 字典，也不会格式化消息
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        # 兼容把上下文作为第一个参数（logger.info(ctx, "消息")）
+        # 或作为第二个位置参数（logger.info("消息", ctx)）的写法
+        if isinstance(message, Context):
+            context, message = message, args[0] if args else ""
+            args = args[1:]
+        elif args and context is None and isinstance(args[0], Context):
+            context, args = args[0], args[1:]
+        
         # 如果没有传入上下文，尝试获取当前上下文
         if context is None:
-            context = get_current_context()
+            context = _get_context()
         
         # 构建额外信息
-        extra = {}
-        if context:
-            extra['trace_id'] = context.trace_id
+        extra = {'trace_id': context.trace_id}
         
         # 分离 logging 参数和 extra 参数
         log_kwargs = {}
-        extra_kwargs = {}
-        
-        # logging 保留的参数
-        log_params = {'exc_info', 'stack_info', 'stacklevel'}
         
         for key, value in kwargs.items():
-            if key in log_params:
+            if key in _LOG_PARAMS:
                 log_kwargs[key] = value
             else:
-                extra_kwargs[key] = value
+                # 添加用户传入的额外信息
+                extra[key] = value
+        
+        # 记录日志（级别已在上方检查，直接调用 _log）；
+        # args 由 LogRecord.getMessage() 在输出时才格式化
+        self.logger._log(level, message, args, extra=extra, **log_kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """判断指定级别的日志是否会被记录，可用于跳过昂贵的日志参数构建"""
+        return self.logger.isEnabledFor(level)
+    
+    @property
+    def debug_enabled(self) -> bool:
+        """DEBUG 级别是否启用（随日志级别配置实时变化）"""
+        return self.logger.isEnabledFor(DEBUG)
+    
+    @property
+    def info_enabled(self) -> bool:
+        """INFO 级别是否启用（随日志级别配置实时变化）"""
+        return self.logger.isEnabledFor(INFO)
+    
+    def log(self, level: int, message: str, *args, context: Optional[Context] = None, **kwargs):
+        """记录指定级别的日志"""
+        self._log(level, context, message, args, **kwargs)
+    
+    def log_bulk(self, level: int, records: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+                 context: Optional[Context] = None):
+        """
+        批量记录多条同级别日志
+        
+        级别检查、上下文获取和调用位置查找只做一次；支持批量接收的处理器
+        （如 AsyncTLSHandler）一次拿到整批日志，在一次加锁内放入队列。
+        
+        Args:
+            level: 日志级别
+            records: (消息, 额外信息字典) 序列，额外信息与 extra 参数相同，可为 None
+            context: 上下文，不传时使用当前上下文
+            
+        Example:
+            >>> logger.log_bulk(logging.INFO, [
+            >>>     ("库存检查", {"order_id": order_id, "available_stock": 10}),
+            >>>     ("支付处理", {"order_id": order_id, "amount": 89.99}),
+            >>> ])
+        """
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
         
-        # 添加用户传入的额外信息
-        extra.update(extra_kwargs)
+        if context is None:
+            context = _get_context()
+        trace_id = context.trace_id
+        
+        try:
+            fn, lno, func = logger.findCaller()[:3]
+        except ValueError:
+            fn, lno, func = "(unknown file)", 0, "(unknown function)"
         
-        # 记录日志
-        self.logger.log(level, message, extra=extra, **log_kwargs)
+        if logger.disabled:
+            return
+        
+        name = logger.name
+        built = []
+        for message, extra in records:
+            record = logger.makeRecord(
+                name, level, fn, lno, message, (), None, func,
+                {'trace_id': trace_id, 'extra': extra} if extra else {'trace_id': trace_id}
+            )
+            if not logger.filters or logger.filter(record):
+                built.append(record)
+        if not built:
+            return
+        
+        # 与 Logger.callHandlers 相同的查找顺序；支持批量的处理器（如 AsyncTLSHandler）一次接收整批日志
+        found = False
+        current = logger
+        while current:
+            for handler in current.handlers:
+                found = True
+                if level < handler.level:
+                    continue
+                handle_many = getattr(handler, 'handle_many', None)
+                if handle_many is not None:
+                    handle_many(built)
+                else:
+                    for record in built:
+                        handler.handle(record)
+            if not current.propagate:
+                break
+            current = current.parent
+        
+        if not found and logging.lastResort is not None and level >= logging.lastResort.level:
+            for record in built:
+                logging.lastResort.handle(record)
     
-    def debug(self, message: str, context: Optional[Context] = None, **kwargs):
+    def debug(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录 DEBUG 级别日志"""
-        self._log(logging.DEBUG, context, message, **kwargs)
+        self._log(DEBUG, context, message, args, **kwargs)
     
-    def info(self, message: str, context: Optional[Context] = None, **kwargs):
+    def info(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录 INFO 级别日志"""
-        self._log(logging.INFO, context, message, **kwargs)
+        self._log(INFO, context, message, args, **kwargs)
     
-    def warning(self, message: str, context: Optional[Context] = None, **kwargs):
+    def warning(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录 WARNING 级别日志"""
-        self._log(logging.WARNING, context, message, **kwargs)
+        self._log(WARNING, context, message, args, **kwargs)
     
-    def error(self, message: str, context: Optional[Context] = None, **kwargs):
+    def error(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录 ERROR 级别日志"""
-        self._log(logging.ERROR, context, message, **kwargs)
+        self._log(ERROR, context, message, args, **kwargs)
     
-    def critical(self, message: str, context: Optional[Context] = None, **kwargs):
+    def critical(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录 CRITICAL 级别日志"""
-        self._log(logging.CRITICAL, context, message, **kwargs)
+        self._log(CRITICAL, context, message, args, **kwargs)
     
-    def exception(self, message: str, context: Optional[Context] = None, **kwargs):
+    def exception(self, message: str, *args, context: Optional[Context] = None, **kwargs):
         """记录异常日志"""
         kwargs['exc_info'] = True
-        self._log(logging.ERROR, context, message, **kwargs)
+        self._log(ERROR, context, message, args, **kwargs)
 
 
 class LoggerManager:
@@ -551,20 +951,20 @@ class LoggerManager:
         
         try:
             from ..nacos_sdk.api import get_config
-            import json
             
             # 首先尝试从 tls.log.config 获取配置
-            tls_log_config = get_config("tls.log.config")
+            raw_config = get_config("tls.log.config")
+            source = "从 Nacos tls.log.config 加载火山引擎配置"
             
-            if tls_log_config:
-                config_data = json.loads(tls_log_config)
-                logging.getLogger("py_sdk.logger").info("从 Nacos tls.log.config 加载火山引擎配置")
-            else:
+            if not raw_config:
                 # 备用：尝试从 volcengine.json 获取配置（保持向后兼容）
-                volcengine_config = get_config("volcengine.json")
-                if volcengine_config:
-                    config_data = json.loads(volcengine_config)
-                    logging.getLogger("py_sdk.logger").info("从 Nacos volcengine.json 加载火山引擎配置（兼容模式）")
+                raw_config = get_config("volcengine.json")
+                source = "从 Nacos volcengine.json 加载火山引擎配置（兼容模式）"
+            
+            # 只解析一次
+            if raw_config:
+                config_data = _json_loads(raw_config)
+                logging.getLogger("py_sdk.logger").info(source)
             
             # 检查是否必须依赖Nacos配置
             if not config_data:
@@ -650,12 +1050,22 @@ class LoggerManager:
         # 文件处理器
         if self.config["handlers"]["file"]["enabled"]:
             file_config = self.config["handlers"]["file"]
-            file_handler = logging.handlers.RotatingFileHandler(
-                filename=file_config["filename"],
-                maxBytes=file_config["max_bytes"],
-                backupCount=file_config["backup_count"],
-                encoding='utf-8'
-            )
+            if file_config.get("buffered", False):
+                # 缓冲模式：后台线程定时刷盘，ERROR 及以上级别立即刷盘
+                file_handler = BufferedRotatingFileHandler(
+                    filename=file_config["filename"],
+                    maxBytes=file_config["max_bytes"],
+                    backupCount=file_config["backup_count"],
+                    encoding='utf-8',
+                    flush_interval=file_config.get("flush_interval", 0.05)
+                )
+            else:
+                file_handler = logging.handlers.RotatingFileHandler(
+                    filename=file_config["filename"],
+                    maxBytes=file_config["max_bytes"],
+                    backupCount=file_config["backup_count"],
+                    encoding='utf-8'
+                )
             file_handler.setLevel(getattr(logging, file_config["level"].upper()))
             file_handler.setFormatter(formatter)
             root_logger.addHandler(file_handler)
@@ -690,11 +1100,33 @@ class LoggerManager:
             
             # 保存TLS处理器引用，用于关闭时清理
             self.tls_handler = tls_handler
+        
+        # 异步输出：由后台线程接管上面创建的所有处理器
+        sink_config = self.config.get("async_sink", {})
+        if sink_config.get("enabled", False):
+            handlers = root_logger.handlers[:]
+            for handler in handlers:
+                root_logger.removeHandler(handler)
+            
+            self.async_sink = AsyncLogSink(
+                handlers,
+                queue_size=sink_config.get("queue_size", 8192),
+                drop_on_full=sink_config.get("drop_on_full", True)
+            )
+            self.async_sink.start()
     
     def close(self):
         """关闭日志管理器"""
         logging.getLogger("py_sdk.logger").info("正在关闭日志管理器...")
         
+        # 停止异步输出，先输出队列中剩余的日志再关闭其处理器
+        if getattr(self, 'async_sink', None):
+            self.async_sink.stop()
+            for handler in self.async_sink.handlers:
+                if handler is not getattr(self, 'tls_handler', None):
+                    handler.close()
+            self.async_sink = None
+        
         # 关闭TLS处理器
         if hasattr(self, 'tls_handler') and self.tls_handler:
             self.tls_handler.close()
@@ -707,6 +1139,28 @@ class LoggerManager:
         
         logging.getLogger("py_sdk.logger").info("日志管理器已关闭")
     
+    def _remove_tls_handlers(self):
+        """关闭并移除现有的TLS处理器（包括由异步输出接管的），避免重新配置时遗留工作线程"""
+        root_logger = logging.getLogger()
+        old_handlers = [
+            handler for handler in root_logger.handlers
+            if isinstance(handler, (AsyncTLSHandler, SyncTLSHandler))
+        ]
+        current = getattr(self, 'tls_handler', None)
+        if current is not None and current not in old_handlers:
+            old_handlers.append(current)
+        
+        async_sink = getattr(self, 'async_sink', None)
+        for handler in old_handlers:
+            root_logger.removeHandler(handler)
+            if async_sink is not None:
+                async_sink.remove_handler(handler)
+            try:
+                handler.close()
+            except Exception:
+                pass  # 忽略关闭错误
+        self.tls_handler = None
+    
     def _setup_tls_handler(self):
         """单独设置TLS处理器"""
         if not self.config.get("handlers", {}).get("tls", {}).get("enabled", False):
@@ -715,10 +1169,7 @@ class LoggerManager:
         root_logger = logging.getLogger()
         
         # 移除现有的TLS处理器
-        for handler in root_logger.handlers[:]:
-            if isinstance(handler, (AsyncTLSHandler, SyncTLSHandler)):
-                handler.close()
-                root_logger.removeHandler(handler)
+        self._remove_tls_handlers()
         
         # 创建格式化器
         formatter = TraceIDFormatter(self.config["format"])
@@ -761,17 +1212,7 @@ class LoggerManager:
         root_logger = logging.getLogger()
         
         # 强制移除所有现有的TLS处理器
-        handlers_to_remove = []
-        for handler in root_logger.handlers:
-            if isinstance(handler, (AsyncTLSHandler, SyncTLSHandler)):
-                handlers_to_remove.append(handler)
-        
-        for handler in handlers_to_remove:
-            try:
-                handler.close()
-            except:
-                pass  # 忽略关闭错误
-            root_logger.removeHandler(handler)
+        self._remove_tls_handlers()
         # 创建格式化器
         formatter = TraceIDFormatter(self.config["format"])
         
@@ -808,16 +1249,16 @@ class LoggerManager:
         logging.getLogger("py_sdk.logger").info("TLS处理器强制重新添加完成")
     
     def get_logger(self, name: str) -> SDKLogger:
-        """获取日志记录器"""
-        if name not in self.loggers:
-            logger = logging.getLogger(name)
-            self.loggers[name] = SDKLogger(name, logger)
-        
-        return self.loggers[name]
+        """获取日志记录器（已创建的直接返回，只做一次字典查找）"""
+        sdk_logger = self.loggers.get(name)
+        if sdk_logger is None:
+            sdk_logger = self.loggers.setdefault(name, SDKLogger(name, logging.getLogger(name)))
+        return sdk_logger
 
 
 # 全局日志管理器实例
 _logger_manager: Optional[LoggerManager] = None
+_logger_manager_lock = threading.Lock()
 
 # 全局logger实例和name
 _global_logger: Optional[SDKLogger] = None
@@ -828,14 +1269,17 @@ def init_logger_manager(config: Dict[str, Any], topic_id: str = None, service_na
     """
     初始化全局日志管理器，并设置全局logger name
     """
-    global _logger_manager, _global_logger, _global_logger_name
-    if _logger_manager is None:
-        _logger_manager = LoggerManager(topic_id=topic_id, service_name=service_name)
-        _logger_manager.init_from_config(config)
+    global _global_logger, _global_logger_name
+    if _logger_manager is None or not _logger_manager.initialized:
+        # 按名称获取日志记录器时可能已创建了（尚未初始化的）管理器，沿用它以保留已缓存的记录器
+        manager = _get_manager_instance()
+        manager.topic_id = topic_id
+        manager.service_name = service_name
+        manager.init_from_config(config)
         if logger_name is None:
             logger_name = service_name
         _global_logger_name = logger_name or "py_sdk"
-        _global_logger = _logger_manager.get_logger(_global_logger_name)
+        _global_logger = manager.get_logger(_global_logger_name)
     else:
         # 如果已经初始化但提供了新的TLS配置，尝试重新配置TLS
         if config.get("handlers", {}).get("tls", {}).get("enabled", False) and (topic_id or service_name):
@@ -873,21 +1317,43 @@ def is_logger_initialized() -> bool:
     return _logger_manager is not None and _logger_manager.initialized
 
 
-def get_logger_manager() -> LoggerManager:
-    """获取全局日志管理器"""
+def _get_manager_instance() -> LoggerManager:
+    """获取全局日志管理器实例（不存在时创建，但不初始化）"""
     global _logger_manager
     if _logger_manager is None:
+        with _logger_manager_lock:
+            if _logger_manager is None:
+                _logger_manager = LoggerManager()
+    return _logger_manager
+
+
+def get_logger_manager() -> LoggerManager:
+    """获取全局日志管理器"""
+    manager = _get_manager_instance()
+    if not manager.initialized:
         # 如果没有初始化，使用默认配置初始化
-        _logger_manager = LoggerManager()
-        _logger_manager.init_from_config({})
+        manager.init_from_config({})
         logging.getLogger("py_sdk.logger").info("使用默认配置初始化日志管理器")
-    return _logger_manager
+    return manager
 
 
-def get_logger() -> SDKLogger:
+def get_logger(name: str = None) -> SDKLogger:
     """
-    获取全局日志记录器，无需传name
+    获取日志记录器
+    
+    Args:
+        name: 日志记录器名称，不传时返回全局日志记录器
+    
+    按名称获取的记录器缓存在全局日志管理器的 loggers 中（与 get_logger_manager().get_logger(name)
+    返回同一实例），且不会触发日志管理器的初始化，可以放心地在模块顶层获取后复用。
     """
+    if name is not None:
+        manager = _logger_manager or _get_manager_instance()
+        sdk_logger = manager.loggers.get(name)
+        if sdk_logger is None:
+            sdk_logger = manager.get_logger(name)
+        return sdk_logger
+    
     global _global_logger
     if _global_logger is None:
         # 若未初始化，使用默认配置和默认name
@@ -6,7 +6,15 @@ from .service import (
     register_services_from_config,
     cleanup
 )
-from .api import get_config
+from .api import (
+    get_config,
+    get_config_async,
+    get_config_json,
+    invalidate_config,
+    preload_configs,
+    add_config_watcher,
+    remove_config_watcher
+)
 
 __all__ = [
     'registerNacos', 
@@ -17,5 +25,11 @@ __all__ = [
     'unregister_service',
     'register_services_from_config',
     'cleanup',
-    'get_config'
+    'get_config',
+    'get_config_async',
+    'get_config_json',
+    'invalidate_config',
+    'preload_configs',
+    'add_config_watcher',
+    'remove_config_watcher'
 ] 
\ No newline at end of file
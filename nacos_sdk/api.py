@@ -1,9 +1,30 @@
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
 import requests
-from typing import Optional
+from types import MappingProxyType
+from urllib.parse import unquote_plus
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .utils import get_http_session, REQUEST_TIMEOUT
 logger = logging.getLogger("nacos-api")
 
+# 长轮询挂起时间（毫秒）：配置无变化时 Nacos 最多挂起请求这么久才返回
+LONG_POLL_TIMEOUT_MS = 30000
+
+# 长轮询协议使用的分隔符
+_WORD_SEPARATOR = "\x02"
+_LINE_SEPARATOR = "\x01"
+
+# 配置变更回调：callback(data_id, group, content)
+ConfigCallback = Callable[[str, str, Optional[str]], None]
+
 class NacosConfigClient:
     """Nacos配置管理客户端"""
     
@@ -19,19 +40,181 @@ class NacosConfigClient:
         self.server_address = server_address
         self.namespace = namespace
         self.base_url = f"http://{server_address}/nacos/v1/cs/configs"
+        
+        # 本地配置缓存：(data_id, group) -> (内容, 获取时间)，读取时按 TTL 判断是否过期
+        self.cache_ttl = _get_cache_ttl()
+        self._cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        
+        # 配置监听：(data_id, group) -> 回调列表 / 已知内容的 MD5
+        self._watchers: Dict[Tuple[str, str], List[ConfigCallback]] = {}
+        self._watch_md5: Dict[Tuple[str, str], str] = {}
+        self._watch_lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
         logger.info(f"初始化Nacos配置客户端: {server_address}, namespace: {namespace}")
     
-    def get_config(self, data_id: str, group: str = "DEFAULT_GROUP") -> Optional[str]:
+    def get_config(self, data_id: str, group: str = "DEFAULT_GROUP", use_cache: bool = True,
+                   ttl: Optional[float] = None) -> Optional[str]:
         """
         获取配置内容
         
         Args:
             data_id: 配置的dataId
             group: 配置的分组，默认为DEFAULT_GROUP
+            use_cache: 是否使用本地 TTL 缓存，需要最新配置时传 False
+            ttl: 本次调用可接受的缓存时长（秒），为None时使用 NACOS_CONFIG_CACHE_TTL
             
         Returns:
             配置内容字符串，如果获取失败返回None
         """
+        if use_cache:
+            content = self.get_cached(data_id, group, ttl)
+            if content is not None:
+                return content
+        
+        content = self._fetch_config(data_id, group)
+        
+        # 只缓存成功获取的配置，失败时下次重新请求
+        if content is not None:
+            self._cache[(data_id, group)] = (content, time.monotonic())
+        
+        return content
+    
+    def get_cached(self, data_id: str, group: str = "DEFAULT_GROUP", ttl: Optional[float] = None) -> Optional[str]:
+        """
+        只读取本地缓存中未过期的配置（不请求 Nacos），没有时返回None
+        
+        Args:
+            ttl: 可接受的缓存时长（秒），为None时使用 NACOS_CONFIG_CACHE_TTL，不大于 0 时不使用缓存
+        """
+        max_age = self.cache_ttl if ttl is None else ttl
+        if max_age <= 0:
+            return None
+        entry = self._cache.get((data_id, group))
+        if entry is not None and time.monotonic() - entry[1] < max_age:
+            return entry[0]
+        return None
+    
+    def invalidate(self, data_id: str, group: str = "DEFAULT_GROUP"):
+        """清除指定配置的本地缓存"""
+        self._cache.pop((data_id, group), None)
+    
+    def add_watcher(self, data_id: str, group: str, callback: ConfigCallback):
+        """
+        添加配置变更监听
+        
+        通过 Nacos 长轮询接口监听，配置无变化时不产生额外请求；
+        配置变化时清除本地缓存并调用 callback(data_id, group, content)。
+        
+        Args:
+            data_id: 配置的dataId
+            group: 配置的分组
+            callback: 变更回调
+        """
+        key = (data_id, group)
+        with self._watch_lock:
+            known = key in self._watch_md5
+        
+        # 在锁外拉取初始内容，避免网络请求期间阻塞监听线程和其他调用方
+        md5 = None if known else _md5(self._fetch_config(data_id, group))
+        
+        with self._watch_lock:
+            if md5 is not None:
+                self._watch_md5.setdefault(key, md5)
+            self._watchers.setdefault(key, []).append(callback)
+            
+            if self._watch_thread is None or not self._watch_thread.is_alive():
+                self._watch_thread = threading.Thread(
+                    target=self._watch_loop, name="nacos-config-watcher", daemon=True
+                )
+                self._watch_thread.start()
+    
+    def remove_watcher(self, data_id: str, group: str, callback: Optional[ConfigCallback] = None):
+        """
+        移除配置变更监听
+        
+        Args:
+            data_id: 配置的dataId
+            group: 配置的分组
+            callback: 要移除的回调，为None时移除该配置的全部回调
+        """
+        key = (data_id, group)
+        with self._watch_lock:
+            callbacks = self._watchers.get(key)
+            if callbacks is None:
+                return
+            if callback is not None and callback in callbacks:
+                callbacks.remove(callback)
+            if callback is None or not callbacks:
+                del self._watchers[key]
+                self._watch_md5.pop(key, None)
+    
+    def _watch_loop(self):
+        """长轮询线程：没有监听的配置时退出"""
+        while True:
+            with self._watch_lock:
+                if not self._watchers:
+                    self._watch_thread = None
+                    return
+                listening = "".join(
+                    _WORD_SEPARATOR.join(
+                        (data_id, group, md5, self.namespace) if self.namespace else (data_id, group, md5)
+                    ) + _LINE_SEPARATOR
+                    for (data_id, group), md5 in self._watch_md5.items()
+                )
+            
+            try:
+                changed = self._long_poll(listening)
+            except Exception as e:
+                logger.error(f"配置监听异常: {str(e)}")
+                time.sleep(5)
+                continue
+            
+            for data_id, group in changed:
+                self._on_changed(data_id, group)
+    
+    def _long_poll(self, listening: str) -> List[Tuple[str, str]]:
+        """发起一次长轮询，返回发生变化的 (data_id, group) 列表"""
+        response = get_http_session().post(
+            f"{self.base_url}/listener",
+            data={"Listening-Configs": listening},
+            headers={"Long-Pulling-Timeout": str(LONG_POLL_TIMEOUT_MS)},
+            timeout=LONG_POLL_TIMEOUT_MS / 1000 + REQUEST_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"status={response.status_code}, text={response.text}")
+        
+        changed = []
+        for line in unquote_plus(response.text).split(_LINE_SEPARATOR):
+            if line:
+                words = line.split(_WORD_SEPARATOR)
+                if len(words) >= 2:
+                    changed.append((words[0], words[1]))
+        return changed
+    
+    def _on_changed(self, data_id: str, group: str):
+        """拉取变化后的配置，更新缓存并调用回调"""
+        key = (data_id, group)
+        content = self._fetch_config(data_id, group)
+        
+        with self._watch_lock:
+            if key not in self._watchers:
+                return
+            self._watch_md5[key] = _md5(content)
+            callbacks = list(self._watchers[key])
+        
+        self.invalidate(data_id, group)
+        if content is not None:
+            self._cache[key] = (content, time.monotonic())
+        
+        logger.info(f"配置发生变化: dataId={data_id}, group={group}")
+        for callback in callbacks:
+            try:
+                callback(data_id, group, content)
+            except Exception as e:
+                logger.error(f"配置变更回调异常: dataId={data_id}, group={group}, error={str(e)}")
+    
+    def _fetch_config(self, data_id: str, group: str) -> Optional[str]:
+        """从 Nacos 服务器获取配置内容"""
         try:
             params = {
                 "dataId": data_id,
@@ -42,7 +225,7 @@ class NacosConfigClient:
             if self.namespace:
                 params["tenant"] = self.namespace
             
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = get_http_session().get(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 config_content = response.text
@@ -63,6 +246,22 @@ class NacosConfigClient:
             return None
 
 
+def _md5(content: Optional[str]) -> str:
+    """计算配置内容的 MD5（与 Nacos 服务端一致，配置不存在时为空字符串）"""
+    if content is None:
+        return ""
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+def _get_cache_ttl() -> float:
+    """读取配置缓存时间（环境变量 NACOS_CONFIG_CACHE_TTL，单位秒，默认 0 即不缓存）"""
+    try:
+        return float(os.getenv('NACOS_CONFIG_CACHE_TTL', '0'))
+    except ValueError:
+        logger.warning("NACOS_CONFIG_CACHE_TTL 不是合法数字，不启用缓存")
+        return 0.0
+
+
 # 全局配置客户端实例
 _config_client: Optional[NacosConfigClient] = None
 
@@ -80,13 +279,19 @@ def _init_client():
         _config_client = NacosConfigClient(server_address, namespace)
         logger.info("Nacos配置客户端已初始化")
 
-def get_config(data_id: str, group: str = "DEFAULT_GROUP") -> Optional[str]:
+def get_config(data_id: str, group: str = "DEFAULT_GROUP", use_cache: bool = True,
+               ttl: Optional[float] = None) -> Optional[str]:
     """
     获取Nacos配置
     
+    默认每次调用都从 Nacos 获取最新配置；设置 NACOS_CONFIG_CACHE_TTL（秒）或传入 ttl 后，
+    缓存期内的重复调用直接返回本地缓存的配置，不会再请求 Nacos。
+    
     Args:
         data_id: 配置的dataId
         group: 配置的分组，默认为DEFAULT_GROUP
+        use_cache: 是否使用本地缓存，需要最新配置时（如监听配置变更）传 False
+        ttl: 本次调用可接受的缓存时长（秒），为None时使用 NACOS_CONFIG_CACHE_TTL
         
     Returns:
         配置内容字符串，如果获取失败返回None
@@ -96,12 +301,170 @@ def get_config(data_id: str, group: str = "DEFAULT_GROUP") -> Optional[str]:
         >>> config = get_config("database.properties", "DEFAULT_GROUP")
         >>> if config:
         >>>     print(config)
+        >>> # 30 秒内的重复读取直接使用本地缓存
+        >>> config = get_config("logger.json", ttl=30)
     """
     # 确保客户端已初始化
     if _config_client is None:
         _init_client()
     
-    return _config_client.get_config(data_id, group)
+    return _config_client.get_config(data_id, group, use_cache=use_cache, ttl=ttl)
+
+
+async def get_config_async(data_id: str, group: str = "DEFAULT_GROUP", use_cache: bool = True,
+                           ttl: Optional[float] = None) -> Optional[str]:
+    """
+    异步获取Nacos配置
+    
+    命中本地缓存时直接返回；否则在线程池中执行阻塞的 HTTP 请求，不阻塞事件循环。
+    参数和返回值与 get_config 相同。
+    
+    Example:
+        >>> from nacos_sdk import get_config_async
+        >>> db, redis = await asyncio.gather(
+        >>>     get_config_async("database.json"),
+        >>>     get_config_async("redis.json")
+        >>> )
+    """
+    if _config_client is not None and use_cache:
+        content = _config_client.get_cached(data_id, group, ttl)
+        if content is not None:
+            return content
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(get_config, data_id, group, use_cache, ttl)
+    )
+
+
+def preload_configs(data_ids: Iterable[str], group: str = "DEFAULT_GROUP") -> Dict[str, Optional[str]]:
+    """
+    启动时并发预加载多个配置
+    
+    各配置在线程池中同时请求，总耗时约为最慢的一次请求而非所有请求之和；
+    成功获取的配置写入本地缓存，之后开启了缓存（NACOS_CONFIG_CACHE_TTL 或 ttl 参数）的
+    get_config 调用在缓存期内不再请求 Nacos。
+    
+    Args:
+        data_ids: 配置的dataId列表
+        group: 配置的分组，默认为DEFAULT_GROUP
+        
+    Returns:
+        dataId -> 配置内容（获取失败为None）
+        
+    Example:
+        >>> from nacos_sdk import preload_configs
+        >>> configs = preload_configs(["logger.json", "tls.log.config", "services.json"])
+    """
+    data_ids = list(dict.fromkeys(data_ids))
+    if not data_ids:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(len(data_ids), 8), thread_name_prefix="nacos-preload") as executor:
+        contents = executor.map(lambda data_id: get_config(data_id, group), data_ids)
+        return dict(zip(data_ids, contents))
+
+
+def _freeze(value: Any) -> Any:
+    """把解析结果转换为只读结构：dict 转为 MappingProxyType，list 转为 tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_config_json(content: str) -> Optional[Any]:
+    """解析 JSON 配置（按配置内容缓存，内容不变时不重复解析；结果只读，可在多次调用间安全共享）"""
+    try:
+        return _freeze(json.loads(content))
+    except ValueError as e:
+        logger.error(f"配置不是合法的 JSON: {e}")
+        return None
+
+
+def get_config_json(data_id: str, group: str = "DEFAULT_GROUP", ttl: Optional[float] = None) -> Optional[Any]:
+    """
+    获取并解析 JSON 格式的 Nacos 配置（带解析缓存）
+    
+    配置内容通过 get_config 获取（遵循 NACOS_CONFIG_CACHE_TTL 和 ttl 参数），解析结果按配置内容缓存：
+    内容未变化时不会重新解析，内容变化后自动得到新的解析结果，不会返回过期配置。
+    解析缓存只省去 JSON 解析；未设置 NACOS_CONFIG_CACHE_TTL 且未传 ttl 时，每次调用仍会请求一次 Nacos。
+    
+    Args:
+        data_id: 配置的dataId
+        group: 配置的分组，默认为DEFAULT_GROUP
+        ttl: 本次调用可接受的缓存时长（秒），为None时使用 NACOS_CONFIG_CACHE_TTL
+        
+    Returns:
+        解析后的只读配置对象（对象为 MappingProxyType，数组为 tuple），如果获取或解析失败返回None
+        
+    Note:
+        返回的对象在多次调用间共享，因此是只读的；需要修改时请用 json.loads(get_config(...)) 得到独立的副本。
+        
+    Example:
+        >>> from nacos_sdk import get_config_json
+        >>> config = get_config_json("app.json")
+        >>> if config:
+        >>>     print(config["database"])
+    """
+    content = get_config(data_id, group, ttl=ttl)
+    if content is None:
+        return None
+    return _parse_config_json(content)
+
+
+def invalidate_config(data_id: str, group: str = "DEFAULT_GROUP"):
+    """
+    使指定配置的本地 TTL 缓存失效，get_config / get_config_json 下次调用时重新拉取
+    （通常在配置变更监听回调中调用）
+    
+    Args:
+        data_id: 配置的dataId
+        group: 配置的分组，默认为DEFAULT_GROUP
+    """
+    if _config_client is not None:
+        _config_client.invalidate(data_id, group)
+
+
+def add_config_watcher(data_id: str, group: str, callback: ConfigCallback):
+    """
+    监听Nacos配置变更
+    
+    基于 Nacos 长轮询，配置无变化时没有额外请求，变化后通常在一秒内回调。
+    配置变化时会自动清除 get_config / get_config_json 的本地缓存。
+    
+    Args:
+        data_id: 配置的dataId
+        group: 配置的分组
+        callback: 变更回调，签名为 callback(data_id, group, content)，
+            配置被删除时 content 为None；回调在监听线程中执行，应尽快返回
+        
+    Example:
+        >>> from nacos_sdk import add_config_watcher
+        >>> def on_change(data_id, group, content):
+        >>>     print(f"{data_id} 已更新")
+        >>> add_config_watcher("app.json", "DEFAULT_GROUP", on_change)
+    """
+    if _config_client is None:
+        _init_client()
+    
+    _config_client.add_watcher(data_id, group, callback)
+
+
+def remove_config_watcher(data_id: str, group: str, callback: Optional[ConfigCallback] = None):
+    """
+    取消Nacos配置变更监听
+    
+    Args:
+        data_id: 配置的dataId
+        group: 配置的分组
+        callback: 要移除的回调，为None时移除该配置的全部回调
+    """
+    if _config_client is not None:
+        _config_client.remove_watcher(data_id, group, callback)
+
 
 # 模块导入时自动初始化
-_init_client() 
\ No newline at end of file
+_init_client()
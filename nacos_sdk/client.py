@@ -5,9 +5,9 @@ import logging
 import asyncio
 import os
 from typing import Dict, Any, Optional, List, Union
-import requests
 
 from .exceptions import NacosException
+from .utils import get_http_session, REQUEST_TIMEOUT
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("nacos-client")
@@ -80,7 +80,7 @@ class NacosClient:
                 "username": self.username,
                 "password": self.password
             }
-            response = requests.post(url, params=params)
+            response = get_http_session().post(url, params=params, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 self.auth_token = data.get("accessToken")
@@ -135,7 +135,7 @@ class NacosClient:
                 "namespaceId": self.namespace
             }
             params = self._build_request_params(params)
-            response = requests.post(url, params=params)
+            response = get_http_session().post(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200 and response.text.upper() == "OK":
                 logger.info(f"Successfully registered service: {service_name}:{ip}:{port}")
@@ -180,7 +180,7 @@ class NacosClient:
                 "namespaceId": self.namespace
             }
             params = self._build_request_params(params)
-            response = requests.delete(url, params=params)
+            response = get_http_session().delete(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200 and response.text.upper() == "OK":
                 logger.info(f"Successfully deregistered service: {service_name}:{ip}:{port}")
@@ -231,7 +231,7 @@ class NacosClient:
             }
             
             params = self._build_request_params(params)
-            response = requests.put(url, params=params)
+            response = get_http_session().put(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to send beat: {response.text}")
@@ -309,7 +309,7 @@ class NacosClient:
             if clusters:
                 params["clusters"] = clusters
             params = self._build_request_params(params)
-            response = requests.get(url, params=params)
+            response = get_http_session().get(url, params=params, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 result = response.json()
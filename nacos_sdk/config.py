@@ -1,24 +1,96 @@
+import codecs
 import logging
 import os
+import re
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 logger = logging.getLogger("nacos-config")
 
-# 尝试加载.env文件
+# .env 行格式：[export ]KEY=VALUE，VALUE 可以用单/双引号包裹；
+# 未加引号的值中，空白之后的 # 才开始注释（与 python-dotenv 一致，E=a#b 的值为 a#b）
+_ENV_LINE_PATTERN = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([^=#\s]+)[ \t]*=[ \t]*'
+    r'(?:"((?:\\"|[^"])*)"[ \t]*(?:#[^\r\n]*)?|\'((?:\\\'|[^\'])*)\'[ \t]*(?:#[^\r\n]*)?|([^\r\n]*))$',
+    re.MULTILINE
+)
+_INLINE_COMMENT_PATTERN = re.compile(r'\s+#.*')
+
+# 引号内支持的转义序列（与 python-dotenv 一致）
+_DOUBLE_QUOTE_ESCAPES = re.compile(r'\\[\\\'"abfnrtv]')
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+
+# 变量展开：${NAME} 或 ${NAME:-默认值}
+_VARIABLE_PATTERN = re.compile(r'\$\{([^}:]*)(?::-([^}]*))?\}')
+
+
+def _decode_escapes(pattern: re.Pattern, value: str) -> str:
+    # 绝大多数值不含转义，跳过正则替换
+    if '\\' not in value:
+        return value
+    return pattern.sub(lambda m: codecs.decode(m.group(0), 'unicode-escape'), value)
+
+
+def _expand_variables(value: str, env: Dict[str, str]) -> str:
+    return _VARIABLE_PATTERN.sub(lambda m: env.get(m.group(1), m.group(2) or ''), value)
+
+
+def load_env_file(env_file_path: str, override: bool = False) -> Dict[str, str]:
+    """
+    解析 .env 文件并写入环境变量（不依赖 python-dotenv）
+    
+    一次读取整个文件，用预编译正则提取所有键值对，最后一次性更新 os.environ。
+    引号、转义、行内注释和 ${VAR} 变量展开的规则与 python-dotenv 的 load_dotenv 相同。
+    
+    Args:
+        env_file_path: .env 文件路径
+        override: 是否覆盖已存在的环境变量，默认不覆盖（与 load_dotenv 一致）
+        
+    Returns:
+        文件中解析出的键值对
+    """
+    text = Path(env_file_path).read_text(encoding='utf-8')
+    
+    parsed = {}
+    for match in _ENV_LINE_PATTERN.finditer(text):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = _decode_escapes(_DOUBLE_QUOTE_ESCAPES, double_quoted)
+        elif single_quoted is not None:
+            value = _decode_escapes(_SINGLE_QUOTE_ESCAPES, single_quoted)
+        else:
+            value = _INLINE_COMMENT_PATTERN.sub('', bare).rstrip()
+        
+        # 变量引用依次解析：不覆盖时已存在的环境变量优先，否则文件中先定义的值优先
+        if '${' in value:
+            env = {**os.environ, **parsed} if override else {**parsed, **os.environ}
+            value = _expand_variables(value, env)
+        parsed[key] = value
+    
+    if override:
+        os.environ.update(parsed)
+    else:
+        os.environ.update({k: v for k, v in parsed.items() if k not in os.environ})
+    
+    logger.debug(f"已从 {env_file_path} 解析 {len(parsed)} 个环境变量")
+    return parsed
+
+
+# 尝试加载.env文件（优先使用 python-dotenv，未安装时使用内置解析）
 try:
     from dotenv import load_dotenv
-    # 尝试从不同位置加载.env文件
-    env_paths = ['./.env', '../.env', '/app/.env', '/app/rest/.env']
-    for env_path in env_paths:
-        if os.path.exists(env_path):
-            load_dotenv(env_path)
-            logger.info(f"已从 {env_path} 加载环境变量配置")
-            break
-    else:
-        logger.warning("未找到.env文件，将使用系统环境变量")
 except ImportError:
-    logger.warning("未安装python-dotenv，无法从.env文件加载配置")
+    load_dotenv = load_env_file
+
+# 尝试从不同位置加载.env文件
+env_paths = ['./.env', '../.env', '/app/.env', '/app/rest/.env']
+for env_path in env_paths:
+    if os.path.exists(env_path):
+        load_dotenv(env_path)
+        logger.info(f"已从 {env_path} 加载环境变量配置")
+        break
+else:
+    logger.warning("未找到.env文件，将使用系统环境变量")
 
 # 默认的服务配置
 DEFAULT_SERVICES = [
@@ -6,6 +6,8 @@ Nacos配置获取API使用示例
 这个示例展示了如何使用nacos.api模块来获取配置
 """
 
+import json
+
 from . import get_config
 
 def main():
@@ -36,7 +38,6 @@ def main():
         print(f"配置内容:\n{config3}")
         # 如果是JSON格式，可以进一步解析
         try:
-            import json
             parsed_config = json.loads(config3)
             print(f"解析后的配置: {parsed_config}")
         except json.JSONDecodeError:
@@ -1,11 +1,54 @@
 import socket
+import atexit
 import logging
 import platform
+import threading
 import subprocess
 from typing import Dict, List, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
+# 安全导入 urllib3
+try:
+    from urllib3.util.retry import Retry
+except ImportError:
+    from requests.packages.urllib3.util.retry import Retry
+
 logger = logging.getLogger("nacos-utils")
 
+# Nacos 请求超时时间（秒），避免服务端无响应时阻塞调用方
+REQUEST_TIMEOUT = 10
+
+# 连接失败等瞬时错误的重试策略：连接阶段的错误对所有方法重试（请求尚未发出），
+# 读取阶段的错误只对 GET 等幂等方法重试，避免重复注册/注销
+_RETRY = Retry(total=2, backoff_factor=0.1)
+
+# 所有 Nacos 请求（注册/注销/心跳/配置）共享的 HTTP 会话，复用 TCP 连接
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    获取共享的 HTTP 会话（带连接池）
+    
+    Returns:
+        requests.Session 实例（keep-alive 连接池，瞬时错误自动重试），进程退出时自动关闭
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_RETRY)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                _http_session = session
+    return _http_session
+
+
 def get_local_ip() -> str:
     """
     获取本机IP地址
@@ -29,6 +29,14 @@ extras_require = {
         "volcengine>=1.0.184",
         "lz4>=4.0.0",
     ],
+    # 性能加速（可选）
+    "speedups": [
+        "orjson>=3.6.0",
+    ],
+    # HTTP/2 连接池（DingBot 等）
+    "http2": [
+        "httpx[http2]>=0.23.0",
+    ],
     # Web 框架支持
     "web": [
         "fastapi>=0.68.0",
@@ -0,0 +1,23 @@
+"""
+测试配置
+
+仓库根目录即 py_sdk 包本身（子模块之间使用相对导入），
+测试前把根目录注册为 py_sdk 包，测试中统一通过 py_sdk.xxx 导入。
+
+运行测试：pip install -e ".[dev]" 后执行 pytest（pyproject 的 addopts 需要 pytest-cov）；
+未安装 pytest-cov 时执行 pytest -o addopts=""。
+"""
+
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "py_sdk" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "py_sdk", os.path.join(ROOT, "__init__.py"), submodule_search_locations=[ROOT]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["py_sdk"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,41 @@
+"""上下文模块测试"""
+
+from py_sdk.context import manager
+from py_sdk.context.manager import NULL_TRACE_ID, create_context, get_current_context
+
+
+class TestSampling:
+    """TRACE_SAMPLE_RATE 采样"""
+
+    def test_unsampled_context_is_not_shared(self, monkeypatch):
+        monkeypatch.setattr(manager, "_TRACE_SAMPLE_RATE", 0.0)
+
+        first = create_context()
+        second = create_context()
+
+        assert first.trace_id == NULL_TRACE_ID
+        assert second.trace_id == NULL_TRACE_ID
+        assert first is not second
+        assert first is not manager._NULL_CTX
+        assert get_current_context() is second
+
+        # 修改一个未采样的上下文不会影响其他上下文和默认哨兵
+        first.trace_id = "changed"
+        assert second.trace_id == NULL_TRACE_ID
+        assert manager._NULL_CTX.trace_id == NULL_TRACE_ID
+
+    def test_explicit_trace_id_is_not_sampled(self, monkeypatch):
+        monkeypatch.setattr(manager, "_TRACE_SAMPLE_RATE", 0.0)
+
+        assert create_context("custom-trace-id").trace_id == "custom-trace-id"
+
+    def test_request_context_is_sampled(self, monkeypatch):
+        monkeypatch.setattr(manager, "_TRACE_SAMPLE_RATE", 0.0)
+
+        class Request:
+            headers = {}
+
+        assert manager._context_from_request(Request()).trace_id == NULL_TRACE_ID
+
+        Request.headers = {"X-Trace-Id": "from-header"}
+        assert manager._context_from_request(Request()).trace_id == "from-header"
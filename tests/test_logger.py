@@ -0,0 +1,219 @@
+"""日志模块测试"""
+
+import logging
+import os
+import threading
+
+import pytest
+
+from py_sdk.logger import manager as manager_module
+from py_sdk.logger.manager import (
+    AsyncTLSHandler, BufferedRotatingFileHandler, get_logger, get_logger_manager
+)
+
+
+def _make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+class TestGetLogger:
+    """按名称获取日志记录器"""
+
+    def test_named_logger_shared_with_manager(self):
+        sdk_logger = get_logger("tests.shared")
+        assert sdk_logger is get_logger("tests.shared")
+        assert sdk_logger is get_logger_manager().get_logger("tests.shared")
+        assert get_logger_manager().get_logger("tests.other") is get_logger("tests.other")
+
+
+class TestBufferedRotatingFileHandler:
+    """带写缓冲的滚动文件处理器"""
+
+    def test_rollover_counts_encoded_bytes(self, tmp_path):
+        filename = str(tmp_path / "app.log")
+        max_bytes = 2000
+        handler = BufferedRotatingFileHandler(filename, maxBytes=max_bytes, backupCount=50,
+                                              encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        total = 300
+        try:
+            for i in range(total):
+                handler.emit(_make_record(f"中文日志记录 第{i}条"))
+        finally:
+            handler.close()
+
+        files = [f for f in os.listdir(tmp_path) if f.startswith("app.log")]
+        assert len(files) > 1
+
+        lines = 0
+        for name in files:
+            path = os.path.join(tmp_path, name)
+            # 按字节计算大小：多字节字符不能让文件超出 maxBytes
+            assert os.path.getsize(path) <= max_bytes
+            with open(path, encoding="utf-8") as f:
+                lines += len(f.readlines())
+        assert lines == total
+
+    def test_size_continues_from_existing_file(self, tmp_path):
+        filename = str(tmp_path / "app.log")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("已有内容\n")
+
+        handler = BufferedRotatingFileHandler(filename, maxBytes=1000, encoding="utf-8")
+        try:
+            assert handler._size == len("已有内容\n".encode("utf-8"))
+        finally:
+            handler.close()
+
+
+class _FakeTLSLogs:
+    """代替火山引擎 SDK 的 PutLogsV2Logs，只记录日志内容"""
+
+    def __init__(self, source: str, filename: str):
+        self.messages = []
+
+    def add_log(self, contents, log_time):
+        self.messages.append(contents["message"])
+
+
+class _FakeTLSRequest:
+    """代替火山引擎 SDK 的 PutLogsV2Request"""
+
+    def __init__(self, topic_id: str, logs: _FakeTLSLogs):
+        self.topic_id = topic_id
+        self.logs = logs
+
+
+class _FakeTLSClient:
+    """记录收到的日志；gate 未打开时发送会阻塞，用来模拟发送缓慢的 TLS 服务"""
+
+    def __init__(self, blocking: bool = False):
+        self.sent = []
+        self.calls = 0
+        self.gate = threading.Event()
+        if not blocking:
+            self.gate.set()
+        self._cond = threading.Condition()
+
+    def put_logs_v2(self, request: _FakeTLSRequest):
+        with self._cond:
+            self.calls += 1
+            self._cond.notify_all()
+        self.gate.wait()
+        with self._cond:
+            self.sent.extend(request.logs.messages)
+
+    def wait_calls(self, count: int, timeout: float = 5.0) -> bool:
+        """等待至少 count 次发送进入 put_logs_v2"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.calls >= count, timeout)
+
+
+@pytest.fixture
+def tls_client(monkeypatch):
+    """通过 _get_tls_client / _get_tls_request_classes 注入假的 TLS 客户端，不依赖火山引擎 SDK"""
+    clients = []
+
+    def make_client(blocking: bool = False) -> _FakeTLSClient:
+        client = _FakeTLSClient(blocking)
+        clients.append(client)
+        monkeypatch.setattr(manager_module, "_get_tls_client", lambda *args: client)
+        return client
+
+    monkeypatch.setattr(manager_module, "_get_tls_request_classes",
+                        lambda: (_FakeTLSRequest, _FakeTLSLogs))
+    yield make_client
+    # 测试失败时也放行阻塞中的发送，避免工作线程悬挂
+    for client in clients:
+        client.gate.set()
+
+
+def _make_tls_handler(**config) -> AsyncTLSHandler:
+    config.setdefault("endpoint", "https://tls.example.com")
+    config.setdefault("retry_times", 1)
+    return AsyncTLSHandler(config, topic_id="topic")
+
+
+class TestAsyncTLSHandler:
+    """按工作线程分片的 TLS 发送队列"""
+
+    def test_multi_producer_enqueue_and_drain(self, tls_client):
+        client = tls_client()
+        handler = _make_tls_handler(queue_size=100000, worker_threads=4)
+        producers = 8
+        per_producer = 500
+
+        def produce(index):
+            for i in range(per_producer // 2):
+                handler.emit(_make_record(f"{index}-{i}"))
+            handler.handle_many([_make_record(f"{index}-{i}")
+                                 for i in range(per_producer // 2, per_producer)])
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        handler.close()
+
+        expected = {f"{p}-{i}" for p in range(producers) for i in range(per_producer)}
+        assert len(client.sent) == len(expected)
+        assert set(client.sent) == expected
+        assert handler.dropped_count == 0
+
+    def test_handle_many_drops_overflow(self, tls_client):
+        client = tls_client(blocking=True)
+        handler = _make_tls_handler(queue_size=4, worker_threads=1, batch_size=1)
+        handler.emit(_make_record("first"))
+        # 工作线程取走第一条后阻塞在发送中，队列不再被消费
+        assert client.wait_calls(1)
+
+        handler.handle_many([_make_record(str(i)) for i in range(10)])
+        assert handler.dropped_count == 6
+
+        client.gate.set()
+        handler.close()
+        assert client.sent == ["first", "0", "1", "2", "3"]
+
+    def test_single_producer_uses_all_shards(self, tls_client):
+        client = tls_client(blocking=True)
+        handler = _make_tls_handler(queue_size=4, worker_threads=2, batch_size=1)
+        handler.emit(_make_record("a"))
+        handler.emit(_make_record("b"))
+        # 两个工作线程各取走一条（一条来自自己的分片，一条窃取）后阻塞在发送中
+        assert client.wait_calls(2)
+
+        # 单个生产线程：自己的分片满后写入另一个分片，总容量仍为 queue_size
+        handler.handle_many([_make_record(str(i)) for i in range(6)])
+        assert handler.dropped_count == 2
+
+        client.gate.set()
+        handler.close()
+        assert sorted(client.sent) == ["0", "1", "2", "3", "a", "b"]
+
+    def test_block_policy_waits_for_space(self, tls_client):
+        client = tls_client(blocking=True)
+        handler = _make_tls_handler(queue_size=1, worker_threads=1, batch_size=1,
+                                    overflow_policy="block", block_timeout=5.0)
+        handler.emit(_make_record("0"))
+        assert client.wait_calls(1)
+        handler.emit(_make_record("1"))
+
+        producer = threading.Thread(target=handler.emit, args=(_make_record("2"),))
+        producer.start()
+        producer.join(0.2)
+        # 队列已满：阻塞策略下生产线程等待队列空出，而不是丢弃
+        assert producer.is_alive()
+
+        client.gate.set()
+        producer.join(5.0)
+        handler.close()
+        assert not producer.is_alive()
+        assert handler.dropped_count == 0
+        assert client.sent == ["0", "1", "2"]
+
+    def test_invalid_overflow_policy(self, tls_client):
+        tls_client()
+        with pytest.raises(ValueError):
+            _make_tls_handler(overflow_policy="discard")
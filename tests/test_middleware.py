@@ -0,0 +1,57 @@
+"""HTTP 中间件测试"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("requests")
+
+from py_sdk.context.manager import get_current_context
+from py_sdk.http_client.middleware import ASGIMiddleware
+
+
+async def _app(scope, receive, send):
+    """记录处理请求时的 TraceID 并返回 200"""
+    scope["seen_trace_id"] = get_current_context().trace_id
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _request(headers):
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await ASGIMiddleware(_app)(scope, receive, send)
+    return scope, messages
+
+
+class TestASGIMiddleware:
+    """ASGI 中间件"""
+
+    def test_trace_id_round_trip(self):
+        scope, messages = asyncio.run(_request([(b"x-trace-id", b"abc123")]))
+
+        assert scope["seen_trace_id"] == "abc123"
+        assert (b"x-trace-id", b"abc123") in messages[0]["headers"]
+
+    def test_generated_trace_id_is_echoed(self):
+        scope, messages = asyncio.run(_request([]))
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"x-trace-id"].decode("latin-1") == scope["seen_trace_id"]
+
+    def test_context_is_reset_after_request(self):
+        async def main():
+            before = get_current_context()
+            await _request([(b"x-trace-id", b"abc123")])
+            return before, get_current_context()
+
+        before, after = asyncio.run(main())
+
+        assert after is before
@@ -0,0 +1,60 @@
+"""Nacos 配置获取测试"""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from py_sdk.nacos_sdk import api
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.status_code = 200
+        self.text = text
+
+
+class _FakeSession:
+    """代替 HTTP 会话，记录请求次数，每次返回递增的配置内容"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.requests += 1
+        return _FakeResponse(f'{{"version": {self.requests}}}')
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(api, "get_http_session", lambda: session)
+    return session
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("NACOS_CONFIG_CACHE_TTL", raising=False)
+    return api.NacosConfigClient("127.0.0.1:8848")
+
+
+def test_get_config_ttl(session, client):
+    assert client.get_config("app.json", ttl=30) == '{"version": 1}'
+    assert client.get_config("app.json", ttl=30) == '{"version": 1}'
+    assert session.requests == 1
+
+    # 未传 ttl 且未设置 NACOS_CONFIG_CACHE_TTL 时每次都请求 Nacos
+    assert client.get_config("app.json") == '{"version": 2}'
+    assert client.get_config("app.json", ttl=30, use_cache=False) == '{"version": 3}'
+    assert session.requests == 3
+
+
+def test_get_config_json_is_read_only(session, monkeypatch):
+    monkeypatch.setattr(session, "get", lambda *args, **kwargs: _FakeResponse('{"db": {"hosts": ["a"]}}'))
+    monkeypatch.setattr(api, "_config_client", api.NacosConfigClient("127.0.0.1:8848"))
+
+    config = api.get_config_json("app.json")
+
+    assert config["db"]["hosts"] == ("a",)
+    with pytest.raises(TypeError):
+        config["db"]["port"] = 3306
+    assert api.get_config_json("app.json") is config
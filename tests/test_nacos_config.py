@@ -0,0 +1,32 @@
+""".env 解析测试"""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from py_sdk.nacos_sdk.config import load_env_file
+
+
+def test_load_env_file_matches_dotenv(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# 注释\n"
+        "HASH_IN_VALUE=a#b\n"
+        "INLINE_COMMENT=a #c\n"
+        "export ESCAPED=\"a\\\\b\\n\\\"q\\\"\"\n"
+        "SINGLE='it\\'s #not a comment'\n"
+        "EXPANDED=${HASH_IN_VALUE}-${MISSING:-default}\n",
+        encoding="utf-8",
+    )
+    for key in ("HASH_IN_VALUE", "INLINE_COMMENT", "ESCAPED", "SINGLE", "EXPANDED", "MISSING"):
+        monkeypatch.delenv(key, raising=False)
+
+    parsed = load_env_file(str(env_file))
+
+    assert parsed == {
+        "HASH_IN_VALUE": "a#b",
+        "INLINE_COMMENT": "a",
+        "ESCAPED": "a\\b\n\"q\"",
+        "SINGLE": "it's #not a comment",
+        "EXPANDED": "a#b-default",
+    }